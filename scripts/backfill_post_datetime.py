@@ -15,6 +15,7 @@ import time
 from calendar import monthrange
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
@@ -156,7 +157,6 @@ def write_monthly_sort_cache(path: Path, order: str) -> None:
         "classification": classification,
         "size_bytes": size_bytes,
         "mtime_ns": mtime_ns,
-        "updated_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
     }
     try:
         _monthly_sort_cache_path(path).write_text(
@@ -749,6 +749,11 @@ def sorted_rows_by_post_datetime(rows: List[Dict[str, str]], order: str) -> List
             key_clean = str(key).strip()
             if key_clean:
                 field_lookup[key_clean.lower()] = key_clean
+    if order not in {"ascending", "descending"}:
+        raise ValueError(f"Unknown order '{order}'.")
+    descending = order == "descending"
+    # Build the composite key while decorating so the sort itself runs on
+    # itemgetter (C) instead of a Python lambda per comparison.
     decorated = []
     for index, row in enumerate(rows):
         raw_post_datetime = first_row_value(row, field_lookup, POST_DATETIME_ALIASES)
@@ -757,35 +762,29 @@ def sorted_rows_by_post_datetime(rows: List[Dict[str, str]], order: str) -> List
         parsed_post_datetime = normalize_sort_datetime(raw_post_datetime)
         parsed_date = parse_sort_date(raw_sort_date)
         parsed_hour = parse_sort_hour_ending(raw_sort_hour)
-        decorated.append((index, parsed_post_datetime, parsed_date, parsed_hour, row))
-    if order == "ascending":
-        decorated.sort(
-            key=lambda item: (
-                item[1] is None,
-                item[1] or datetime.max,
-                item[2] is None,
-                item[2] or date.max,
-                item[3] is None,
-                item[3] if item[3] is not None else 99,
-                item[0],
+        if descending:
+            sort_key = (
+                parsed_post_datetime is not None,
+                parsed_post_datetime or datetime.min,
+                parsed_date is not None,
+                parsed_date or date.min,
+                parsed_hour is not None,
+                parsed_hour if parsed_hour is not None else -1,
+                -index,
             )
-        )
-    elif order == "descending":
-        decorated.sort(
-            key=lambda item: (
-                item[1] is not None,
-                item[1] or datetime.min,
-                item[2] is not None,
-                item[2] or date.min,
-                item[3] is not None,
-                item[3] if item[3] is not None else -1,
-                -item[0],
-            ),
-            reverse=True,
-        )
-    else:
-        raise ValueError(f"Unknown order '{order}'.")
-    return [item[4] for item in decorated]
+        else:
+            sort_key = (
+                parsed_post_datetime is None,
+                parsed_post_datetime or datetime.max,
+                parsed_date is None,
+                parsed_date or date.max,
+                parsed_hour is None,
+                parsed_hour if parsed_hour is not None else 99,
+                index,
+            )
+        decorated.append((sort_key, row))
+    decorated.sort(key=itemgetter(0), reverse=descending)
+    return [item[1] for item in decorated]
 
 
 def resolve_credentials(args: argparse.Namespace) -> Tuple[str, str, str]:
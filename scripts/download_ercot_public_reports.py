@@ -4,32 +4,67 @@
 from __future__ import annotations
 
 import argparse
-import calendar
+import base64
 import csv
+import heapq
 import io
 import json
+import mmap
+import multiprocessing
 import os
+import pickle
 import re
+import shutil
+import signal
 import sys
+import tempfile
+import threading
 import time
 import zipfile
-from dataclasses import dataclass
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from dataclasses import dataclass, fields
 from datetime import date, datetime, timedelta, timezone
 from functools import lru_cache
+from itertools import chain
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast JSON fallback
+    orjson = None
 try:
     import yaml
 except ImportError:  # pragma: no cover - optional dependency fallback
     yaml = None
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YamlLoader = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
 try:
     from tqdm import tqdm
 except ImportError:  # pragma: no cover - optional progress bar
-    def tqdm(iterable, **_):  # type: ignore[misc]
-        return iterable
+    class tqdm:  # type: ignore[no-redef]
+        """No-op stand-in that also covers manual bars (update/set_postfix/close)."""
+
+        def __init__(self, iterable: Optional[Iterable[Any]] = None, **_: Any) -> None:
+            self.iterable = iterable
+
+        def __iter__(self) -> Iterator[Any]:
+            return iter(self.iterable if self.iterable is not None else ())
+
+        def update(self, n: int = 1) -> None:
+            pass
+
+        def set_postfix(self, **_: Any) -> None:
+            pass
+
+        def close(self) -> None:
+            pass
 
 from ercot_dataset_catalog import (
     DATASETS,
@@ -51,6 +86,27 @@ DEFAULT_RANGE_YEARS = 10
 DEFAULT_FROM_DATE = date(DEFAULT_TO_DATE.year - DEFAULT_RANGE_YEARS + 1, 1, 1)
 CSV_PARSE_CACHE_SIZE = 262144
 MONTHLY_SORT_CACHE_VERSION = 1
+MONTHLY_APPEND_BUFFER_BYTES = 16 << 20
+MONTHLY_SORT_WRITE_BUFFER_BYTES = 1 << 20
+MONTHLY_SORT_PARALLEL_MIN_FILES = 4
+MONTHLY_SORT_RUN_ROWS = 250_000
+MONTHLY_SORT_SPILL_BATCH_ROWS = 1024
+HTTP_POOL_SIZE = 32
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# Transport failures, including those raised while a response body is being read.
+TRANSIENT_REQUEST_ERRORS = (requests.exceptions.ChunkedEncodingError, requests.ConnectionError, requests.Timeout)
+BULK_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+# Listing JSON compresses well; urllib3 advertises br/zstd only when brotli/zstandard
+# are installed to decode them. Archive downloads keep the Requests default.
+LISTING_ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+TOKEN_REFRESH_MARGIN_SECONDS = 60.0
+# Resume checkpoints are written every N docs/pages or T seconds, whichever comes first;
+# explicit saves still happen immediately.
+DATASET_STATE_SAVE_EVERY = 128
+DATASET_STATE_SAVE_INTERVAL_SECONDS = 2.0
+MARKER_FLUSH_EVERY = 500
+FAILURES_FLUSH_EVERY = 100
+RUN_LOG_BUFFER_BYTES = 1 << 16
 POST_DATETIME_COLUMN = "postDateTime"
 POST_DATETIME_COLUMN_ALIASES = (
     POST_DATETIME_COLUMN,
@@ -61,7 +117,7 @@ POST_DATETIME_COLUMN_ALIASES = (
 # TODO(after-full-download): Evaluate storage-format migration (.csv.gz or parquet).
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadStats:
     downloaded: int = 0
     skipped_existing: int = 0
@@ -96,6 +152,17 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
+@lru_cache(maxsize=1)
+def _local_iso_for_second(second: int) -> str:
+    return datetime.fromtimestamp(second).astimezone().isoformat(timespec="seconds")
+
+
+def local_now_iso() -> str:
+    # Formatted once per wall-clock second. The UTC offset is still resolved for
+    # each new second, so a long run picks up DST changes.
+    return _local_iso_for_second(int(time.time()))
+
+
 def _log_value(value: object) -> str:
     if isinstance(value, bool):
         return "true" if value else "false"
@@ -113,7 +180,13 @@ def log_event(event: str, **fields: object) -> None:
     parts = [event]
     for key, value in fields.items():
         parts.append(f"{key}={_log_value(value)}")
-    print(" ".join(parts))
+    # One write per event (print() writes the newline separately), so each line
+    # reaches the tee'd streams whole.
+    stream = sys.stdout
+    stream.write(" ".join(parts) + "\n")
+    if event.endswith("_ERROR"):
+        # run.log is block-buffered; errors are on disk as soon as they are logged.
+        stream.flush()
 
 
 def extract_zip_from_memory(byte_data: bytes) -> Dict[str, bytes]:
@@ -149,9 +222,9 @@ def load_config_file(path: Path) -> Dict[str, Any]:
     if suffix in {".yaml", ".yml"}:
         if yaml is None:
             raise SystemExit("PyYAML is required for --config .yaml files. Install with: pip install pyyaml")
-        data = yaml.safe_load(raw)
+        data = yaml.load(raw, Loader=_YamlLoader)
     elif suffix == ".json":
-        data = json.loads(raw)
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     else:
         raise SystemExit("Unsupported config file extension. Use .yaml/.yml or .json.")
     if data is None:
@@ -198,6 +271,139 @@ def _coerce_config_list(value: object, key: str) -> List[str]:
     raise SystemExit(f"Config key '{key}' must be a string or list of strings.")
 
 
+_CONFIG_SCALAR_MAP: Dict[str, str] = {
+    "username": "username",
+    "credentials_username": "username",
+    "password": "password",
+    "credentials_password": "password",
+    "subscription_key": "subscription_key",
+    "credentials_subscription_key": "subscription_key",
+    "outdir": "outdir",
+    "download_outdir": "outdir",
+    "page_size": "page_size",
+    "download_page_size": "page_size",
+    "network_page_size": "page_size",
+    "max_docs_per_dataset": "max_docs_per_dataset",
+    "download_max_docs_per_dataset": "max_docs_per_dataset",
+    "timeout_seconds": "timeout_seconds",
+    "download_timeout_seconds": "timeout_seconds",
+    "network_timeout_seconds": "timeout_seconds",
+    "max_retries": "max_retries",
+    "download_max_retries": "max_retries",
+    "network_max_retries": "max_retries",
+    "retry_sleep_seconds": "retry_sleep_seconds",
+    "download_retry_sleep_seconds": "retry_sleep_seconds",
+    "network_retry_sleep_seconds": "retry_sleep_seconds",
+    "archive_listing_retries": "archive_listing_retries",
+    "download_archive_listing_retries": "archive_listing_retries",
+    "network_archive_listing_retries": "archive_listing_retries",
+    "archive_progress_pages": "archive_progress_pages",
+    "download_archive_progress_pages": "archive_progress_pages",
+    "network_archive_progress_pages": "archive_progress_pages",
+    "max_consecutive_network_failures": "max_consecutive_network_failures",
+    "download_max_consecutive_network_failures": "max_consecutive_network_failures",
+    "network_max_consecutive_network_failures": "max_consecutive_network_failures",
+    "network_failure_cooldown_seconds": "network_failure_cooldown_seconds",
+    "download_network_failure_cooldown_seconds": "network_failure_cooldown_seconds",
+    "network_network_failure_cooldown_seconds": "network_failure_cooldown_seconds",
+    "file_timing_frequency": "file_timing_frequency",
+    "download_file_timing_frequency": "file_timing_frequency",
+    "sort_monthly_output": "sort_monthly_output",
+    "download_sort_monthly_output": "sort_monthly_output",
+    "monthly_sort_strategy": "monthly_sort_strategy",
+    "download_monthly_sort_strategy": "monthly_sort_strategy",
+    "monthly_flush_bytes": "monthly_flush_bytes",
+    "download_monthly_flush_bytes": "monthly_flush_bytes",
+    "download_order": "download_order",
+    "download_download_order": "download_order",
+    "listing_lookahead_pages": "listing_lookahead_pages",
+    "download_listing_lookahead_pages": "listing_lookahead_pages",
+    "network_listing_lookahead_pages": "listing_lookahead_pages",
+    "bulk_workers": "bulk_workers",
+    "download_bulk_workers": "bulk_workers",
+    "network_bulk_workers": "bulk_workers",
+    "download_workers": "download_workers",
+    "download_download_workers": "download_workers",
+    "network_download_workers": "download_workers",
+    "extract_workers": "extract_workers",
+    "download_extract_workers": "extract_workers",
+    "request_interval_seconds": "request_interval_seconds",
+    "download_request_interval_seconds": "request_interval_seconds",
+    "network_request_interval_seconds": "request_interval_seconds",
+    "requests_per_second": "requests_per_second",
+    "download_requests_per_second": "requests_per_second",
+    "network_requests_per_second": "requests_per_second",
+    "request_burst": "request_burst",
+    "download_request_burst": "request_burst",
+    "network_request_burst": "request_burst",
+    "token_url": "token_url",
+    "auth_token_url": "token_url",
+    "client_id": "client_id",
+    "auth_client_id": "client_id",
+    "scope": "scope",
+    "auth_scope": "scope",
+    "state_dir": "state_dir",
+    "resume_state_dir": "state_dir",
+    "state_flush_every": "state_flush_every",
+    "resume_state_flush_every": "state_flush_every",
+    "state_flush_interval_seconds": "state_flush_interval_seconds",
+    "resume_state_flush_interval_seconds": "state_flush_interval_seconds",
+    "logs_dir": "logs_dir",
+    "logging_logs_dir": "logs_dir",
+}
+_CONFIG_BOOL_MAP: Dict[str, str] = {
+    "from_earliest_available": "from_earliest_available",
+    "download_from_earliest_available": "from_earliest_available",
+    "auto_detect_earliest_per_dataset": "auto_detect_earliest_per_dataset",
+    "download_auto_detect_earliest_per_dataset": "auto_detect_earliest_per_dataset",
+    "datasets_only": "datasets_only",
+    "download_datasets_only": "datasets_only",
+    "extract_zips": "extract_zips",
+    "download_extract_zips": "extract_zips",
+    "consolidate_monthly": "consolidate_monthly",
+    "download_consolidate_monthly": "consolidate_monthly",
+    "delete_source_after_consolidation": "delete_source_after_consolidation",
+    "download_delete_source_after_consolidation": "delete_source_after_consolidation",
+    "dry_run": "dry_run",
+    "download_dry_run": "dry_run",
+    "list_api_products": "list_api_products",
+    "sort_existing_monthly": "sort_existing_monthly",
+    "download_sort_existing_monthly": "sort_existing_monthly",
+    "overlap_monthly_sort": "overlap_monthly_sort",
+    "download_overlap_monthly_sort": "overlap_monthly_sort",
+    "write_manifest": "write_manifest",
+    "download_write_manifest": "write_manifest",
+    "pretty_summary": "pretty_summary",
+    "download_pretty_summary": "pretty_summary",
+    "disable_bulk_download": "disable_bulk_download",
+    "download_disable_bulk_download": "disable_bulk_download",
+    "print_file_timing": "print_file_timing",
+    "download_print_file_timing": "print_file_timing",
+    "resume_state": "resume_state",
+    "resume_resume_state": "resume_state",
+}
+_CONFIG_LIST_MAP: Dict[str, str] = {
+    "profile": "profile",
+    "profiles": "profile",
+    "download_profiles": "profile",
+    "dataset": "dataset",
+    "datasets": "dataset",
+    "download_datasets": "dataset",
+    "exclude_dataset": "exclude_dataset",
+    "exclude_datasets": "exclude_dataset",
+    "download_exclude_datasets": "exclude_dataset",
+}
+# Declaration order decides which alias wins when a config sets several of them.
+_CONFIG_KEY_RANK: Dict[str, int] = {
+    key: index
+    for index, key in enumerate((*_CONFIG_SCALAR_MAP, *_CONFIG_BOOL_MAP, *_CONFIG_LIST_MAP))
+}
+
+
+def _present_config_keys(cfg: Dict[str, Any], mapping: Dict[str, str]) -> List[str]:
+    return sorted(cfg.keys() & mapping.keys(), key=_CONFIG_KEY_RANK.__getitem__)
+
+
 def config_to_parser_defaults(config_data: Dict[str, Any]) -> Dict[str, Any]:
     cfg = flatten_config(config_data)
     defaults: Dict[str, Any] = {}
@@ -208,97 +414,10 @@ def config_to_parser_defaults(config_data: Dict[str, Any]) -> Dict[str, Any]:
     ]
     if removed_date_keys:
         raise SystemExit("Deprecated date-range keys are not supported. Use from_date and optional to_date only.")
-    scalar_map = {
-        "username": "username",
-        "credentials_username": "username",
-        "password": "password",
-        "credentials_password": "password",
-        "subscription_key": "subscription_key",
-        "credentials_subscription_key": "subscription_key",
-        "outdir": "outdir",
-        "download_outdir": "outdir",
-        "page_size": "page_size",
-        "download_page_size": "page_size",
-        "network_page_size": "page_size",
-        "max_docs_per_dataset": "max_docs_per_dataset",
-        "download_max_docs_per_dataset": "max_docs_per_dataset",
-        "timeout_seconds": "timeout_seconds",
-        "download_timeout_seconds": "timeout_seconds",
-        "network_timeout_seconds": "timeout_seconds",
-        "max_retries": "max_retries",
-        "download_max_retries": "max_retries",
-        "network_max_retries": "max_retries",
-        "retry_sleep_seconds": "retry_sleep_seconds",
-        "download_retry_sleep_seconds": "retry_sleep_seconds",
-        "network_retry_sleep_seconds": "retry_sleep_seconds",
-        "archive_listing_retries": "archive_listing_retries",
-        "download_archive_listing_retries": "archive_listing_retries",
-        "network_archive_listing_retries": "archive_listing_retries",
-        "archive_progress_pages": "archive_progress_pages",
-        "download_archive_progress_pages": "archive_progress_pages",
-        "network_archive_progress_pages": "archive_progress_pages",
-        "max_consecutive_network_failures": "max_consecutive_network_failures",
-        "download_max_consecutive_network_failures": "max_consecutive_network_failures",
-        "network_max_consecutive_network_failures": "max_consecutive_network_failures",
-        "network_failure_cooldown_seconds": "network_failure_cooldown_seconds",
-        "download_network_failure_cooldown_seconds": "network_failure_cooldown_seconds",
-        "network_network_failure_cooldown_seconds": "network_failure_cooldown_seconds",
-        "file_timing_frequency": "file_timing_frequency",
-        "download_file_timing_frequency": "file_timing_frequency",
-        "sort_monthly_output": "sort_monthly_output",
-        "download_sort_monthly_output": "sort_monthly_output",
-        "monthly_sort_strategy": "monthly_sort_strategy",
-        "download_monthly_sort_strategy": "monthly_sort_strategy",
-        "download_order": "download_order",
-        "download_download_order": "download_order",
-        "request_interval_seconds": "request_interval_seconds",
-        "download_request_interval_seconds": "request_interval_seconds",
-        "network_request_interval_seconds": "request_interval_seconds",
-        "token_url": "token_url",
-        "auth_token_url": "token_url",
-        "client_id": "client_id",
-        "auth_client_id": "client_id",
-        "scope": "scope",
-        "auth_scope": "scope",
-        "state_dir": "state_dir",
-        "resume_state_dir": "state_dir",
-        "logs_dir": "logs_dir",
-        "logging_logs_dir": "logs_dir",
-    }
-    bool_map = {
-        "from_earliest_available": "from_earliest_available",
-        "download_from_earliest_available": "from_earliest_available",
-        "auto_detect_earliest_per_dataset": "auto_detect_earliest_per_dataset",
-        "download_auto_detect_earliest_per_dataset": "auto_detect_earliest_per_dataset",
-        "datasets_only": "datasets_only",
-        "download_datasets_only": "datasets_only",
-        "extract_zips": "extract_zips",
-        "download_extract_zips": "extract_zips",
-        "consolidate_monthly": "consolidate_monthly",
-        "download_consolidate_monthly": "consolidate_monthly",
-        "delete_source_after_consolidation": "delete_source_after_consolidation",
-        "download_delete_source_after_consolidation": "delete_source_after_consolidation",
-        "dry_run": "dry_run",
-        "download_dry_run": "dry_run",
-        "list_api_products": "list_api_products",
-        "sort_existing_monthly": "sort_existing_monthly",
-        "download_sort_existing_monthly": "sort_existing_monthly",
-        "write_manifest": "write_manifest",
-        "download_write_manifest": "write_manifest",
-        "disable_bulk_download": "disable_bulk_download",
-        "download_disable_bulk_download": "disable_bulk_download",
-        "print_file_timing": "print_file_timing",
-        "download_print_file_timing": "print_file_timing",
-        "resume_state": "resume_state",
-        "resume_resume_state": "resume_state",
-    }
-
-    for source_key, target_key in scalar_map.items():
-        if source_key in cfg:
-            defaults[target_key] = cfg[source_key]
-    for source_key, target_key in bool_map.items():
-        if source_key in cfg:
-            defaults[target_key] = _parse_bool(cfg[source_key])
+    for source_key in _present_config_keys(cfg, _CONFIG_SCALAR_MAP):
+        defaults[_CONFIG_SCALAR_MAP[source_key]] = cfg[source_key]
+    for source_key in _present_config_keys(cfg, _CONFIG_BOOL_MAP):
+        defaults[_CONFIG_BOOL_MAP[source_key]] = _parse_bool(cfg[source_key])
 
     if "from_date" in cfg:
         defaults["from_date"] = _coerce_config_date(cfg["from_date"], "from_date")
@@ -309,24 +428,22 @@ def config_to_parser_defaults(config_data: Dict[str, Any]) -> Dict[str, Any]:
     elif "download_to_date" in cfg:
         defaults["to_date"] = _coerce_config_date(cfg["download_to_date"], "download_to_date")
 
-    list_map = {
-        "profile": "profile",
-        "profiles": "profile",
-        "download_profiles": "profile",
-        "dataset": "dataset",
-        "datasets": "dataset",
-        "download_datasets": "dataset",
-        "exclude_dataset": "exclude_dataset",
-        "exclude_datasets": "exclude_dataset",
-        "download_exclude_datasets": "exclude_dataset",
-    }
-    for source_key, target_key in list_map.items():
-        if source_key in cfg:
-            defaults[target_key] = _coerce_config_list(cfg[source_key], source_key)
+    for source_key in _present_config_keys(cfg, _CONFIG_LIST_MAP):
+        defaults[_CONFIG_LIST_MAP[source_key]] = _coerce_config_list(cfg[source_key], source_key)
     return defaults
 
 
 def _safe_int(value: object, default: int = 0) -> int:
+    if type(value) is int:
+        return value
+    if isinstance(value, str):
+        # Decide plain digit strings up front so dirty values skip the ValueError path.
+        text = value.strip()
+        digits = text[1:] if text[:1] in ("-", "+") else text
+        if digits.isdecimal():
+            return int(text)
+        if "_" not in digits:
+            return default
     try:
         return int(value)
     except (TypeError, ValueError):
@@ -347,39 +464,157 @@ def load_dataset_state(state_path: Path) -> Dict[str, Any]:
     if not state_path.exists():
         return {}
     try:
-        payload = json.loads(state_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        payload = _load_cache_line(state_path.read_bytes())
+    except ValueError:
         return {}
     if isinstance(payload, dict):
         return payload
     return {}
 
 
-def save_dataset_state(state_path: Path, payload: Dict[str, Any]) -> None:
+def _write_file_bytes(path: Path, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _encode_dataset_state(payload: Dict[str, Any]) -> bytes:
+    payload["updated_at"] = utc_now_iso()
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+
+
+def _publish_dataset_state(state_path: Path, data: bytes) -> None:
     state_path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = state_path.with_suffix(state_path.suffix + ".tmp")
-    payload["updated_at"] = utc_now_iso()
-    tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    # No fsync: the atomic replace is enough for resume correctness.
+    _write_file_bytes(tmp_path, data)
     tmp_path.replace(state_path)
 
 
+def save_dataset_state(state_path: Path, payload: Dict[str, Any]) -> None:
+    _publish_dataset_state(state_path, _encode_dataset_state(payload))
+
+
+class DatasetStateWriter:
+    """Persist a dataset state dict, coalescing per-doc/per-page checkpoints.
+
+    With an executor, each save snapshots the payload on the calling thread and
+    leaves only the file write to the executor; at most one write is in flight.
+    """
+
+    def __init__(
+        self,
+        state_path: Path,
+        payload: Dict[str, Any],
+        every: int = DATASET_STATE_SAVE_EVERY,
+        interval_seconds: float = DATASET_STATE_SAVE_INTERVAL_SECONDS,
+        before_save: Optional[Callable[[], None]] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> None:
+        self.state_path = state_path
+        self.payload = payload
+        self.every = max(1, every)
+        self.interval_seconds = interval_seconds
+        self.before_save = before_save
+        self.executor = executor
+        self.inflight: Optional[Future[None]] = None
+        self.pending = 0
+        self.saved_at = time.monotonic()
+
+    def checkpoint(self) -> None:
+        self.pending += 1
+        if self.pending >= self.every or (
+            self.interval_seconds > 0 and time.monotonic() - self.saved_at >= self.interval_seconds
+        ):
+            self.save()
+
+    def save(self) -> None:
+        if self.before_save is not None:
+            self.before_save()
+        data = _encode_dataset_state(self.payload)
+        # Also surfaces a failed background write before the next one is queued.
+        self.wait()
+        if self.executor is None:
+            _publish_dataset_state(self.state_path, data)
+        else:
+            self.inflight = self.executor.submit(_publish_dataset_state, self.state_path, data)
+        self.pending = 0
+        self.saved_at = time.monotonic()
+
+    def wait(self) -> None:
+        inflight, self.inflight = self.inflight, None
+        if inflight is not None:
+            inflight.result()
+
+    def flush(self) -> None:
+        if self.pending:
+            self.save()
+        self.wait()
+
+
+def progress_bar(iterable: Optional[Iterable[Any]] = None, **kwargs: Any) -> Any:
+    # Bars draw on the process stderr: main() tees sys.stderr into run.log, and every
+    # bar refresh would otherwise be written (and flushed) to the log file as well.
+    return tqdm(iterable, file=sys.__stderr__ or sys.stderr, **kwargs)
+
+
 def dataset_docs_cache_path(state_dir: Path, dataset_id: str) -> Path:
     return state_dir / f"{dataset_id}.archive_docs.jsonl"
 
 
+def _load_cache_line(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN and >64-bit ints that stdlib json accepts.
+            pass
+    return json.loads(raw)
+
+
+def _dump_cache_line(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _dumps_json(payload: Any, pretty: bool = False) -> str:
+    # pretty matches json.dumps(indent=2); orjson keeps non-ASCII text unescaped.
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0).decode("utf-8")
+        except TypeError:
+            pass
+    if pretty:
+        return json.dumps(payload, indent=2)
+    return json.dumps(payload, separators=(",", ":"))
+
+
 def load_archive_docs_cache(cache_path: Path) -> Tuple[List[Dict[str, Any]], int]:
     docs: List[Dict[str, Any]] = []
     max_page = 0
     if not cache_path.exists():
         return docs, max_page
-    with open(cache_path, "r", encoding="utf-8") as handle:
+    with open(cache_path, "rb") as handle:
         for line in handle:
             raw = line.strip()
             if not raw:
                 continue
             try:
-                payload = json.loads(raw)
-            except json.JSONDecodeError:
+                payload = _load_cache_line(raw)
+            except ValueError:
                 continue
             if isinstance(payload, dict) and "doc" in payload:
                 page = _safe_int(payload.get("page"), 0)
@@ -389,37 +624,102 @@ def load_archive_docs_cache(cache_path: Path) -> Tuple[List[Dict[str, Any]], int
                 doc = payload
             if not isinstance(doc, dict):
                 continue
-            row = dict(doc)
+            # Each decoded line is a fresh dict, so the page is tagged in place.
             if page > 0:
-                row["__archive_page"] = page
-            docs.append(row)
+                doc["__archive_page"] = page
+            docs.append(doc)
             if page > max_page:
                 max_page = page
     return docs, max_page
 
 
-def append_archive_docs_cache(cache_path: Path, page: int, docs: List[Dict[str, Any]]) -> None:
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(cache_path, "a", encoding="utf-8") as handle:
-        for doc in docs:
-            payload = {"page": page, "doc": doc}
-            handle.write(json.dumps(payload, separators=(",", ":")))
-            handle.write("\n")
+class ArchiveDocsCacheWriter:
+    """Buffer listed archive pages and append them to the docs cache in one write."""
+
+    def __init__(self, cache_path: Path) -> None:
+        self.cache_path = cache_path
+        self.pending: List[bytes] = []
+
+    def add(self, page: int, docs: List[Dict[str, Any]]) -> None:
+        self.pending.extend(_dump_cache_line({"page": page, "doc": doc}) for doc in docs)
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, "ab") as handle:
+            handle.write(b"\n".join(self.pending) + b"\n")
+        self.pending = []
+
+
+class ManifestWriter:
+    """Stream manifest rows into a JSON array file as the run goes.
+
+    Rows go to a ``.part`` file that replaces the manifest only when the run
+    finishes, so an interrupted run leaves the previous manifest in place.
+    """
+
+    def __init__(self, path: Path, pretty: bool = False) -> None:
+        self.path = path
+        self.part_path = path.with_name(path.name + ".part")
+        self.pretty = pretty
+        self.handle: Optional[IO[str]] = None
+
+    def add(self, row: Dict[str, object]) -> None:
+        if self.handle is None:
+            self.handle = open(self.part_path, "w", encoding="utf-8")
+            self.handle.write("[\n")
+        else:
+            self.handle.write(",\n")
+        if self.pretty:
+            # Same layout as dumping the whole row list with indent=2.
+            self.handle.write("  " + _dumps_json(row, pretty=True).replace("\n", "\n  "))
+        else:
+            # One compact row per line.
+            self.handle.write(_dumps_json(row))
+
+    def close(self) -> bool:
+        """Publish the manifest; returns False when no rows were written."""
+        if self.handle is None:
+            return False
+        self.handle.write("\n]")
+        self.handle.close()
+        self.handle = None
+        os.replace(self.part_path, self.path)
+        return True
+
+    def discard(self) -> None:
+        if self.handle is None:
+            return
+        self.handle.close()
+        self.handle = None
+        self.part_path.unlink(missing_ok=True)
 
 
 def stats_as_dict(stats: DownloadStats) -> Dict[str, int]:
-    return {
-        "downloaded": stats.downloaded,
-        "skipped_existing": stats.skipped_existing,
-        "skipped_missing_doc_id": stats.skipped_missing_doc_id,
-        "skipped_unavailable_dataset": stats.skipped_unavailable_dataset,
-        "consolidated_updates": stats.consolidated_updates,
-        "monthly_sorted": stats.monthly_sorted,
-        "monthly_already_sorted": stats.monthly_already_sorted,
-        "monthly_sort_skipped": stats.monthly_sort_skipped,
-        "monthly_sort_failures": stats.monthly_sort_failures,
-        "failures": stats.failures,
-    }
+    return {field.name: getattr(stats, field.name) for field in fields(stats)}
+
+
+def _dataset_state_signature(
+    *,
+    dataset_id: str,
+    window_from: date,
+    window_to: date,
+    page_size: int,
+    download_order: str,
+    max_docs_per_dataset: int,
+    archive_url: str,
+) -> List[Any]:
+    # A list (not a tuple) so it still compares equal after a JSON round-trip.
+    return [
+        dataset_id,
+        window_from.isoformat(),
+        window_to.isoformat(),
+        page_size,
+        download_order,
+        max_docs_per_dataset,
+        archive_url,
+    ]
 
 
 def dataset_state_is_compatible(
@@ -435,6 +735,18 @@ def dataset_state_is_compatible(
 ) -> bool:
     if not state:
         return False
+    signature = state.get("_signature")
+    if signature is not None:
+        return signature == _dataset_state_signature(
+            dataset_id=dataset_id,
+            window_from=window_from,
+            window_to=window_to,
+            page_size=page_size,
+            download_order=download_order,
+            max_docs_per_dataset=max_docs_per_dataset,
+            archive_url=archive_url,
+        )
+    # State files written before _signature existed.
     return (
         str(state.get("dataset_id", "")) == dataset_id
         and str(state.get("window_from", "")) == window_from.isoformat()
@@ -472,6 +784,15 @@ def initial_dataset_state(
         "last_completed_doc_id": None,
         "last_completed_stampdate": None,
         "last_completed_page": 0,
+        "_signature": _dataset_state_signature(
+            dataset_id=dataset_id,
+            window_from=window_from,
+            window_to=window_to,
+            page_size=page_size,
+            download_order=download_order,
+            max_docs_per_dataset=max_docs_per_dataset,
+            archive_url=archive_url,
+        ),
     }
 
 
@@ -535,10 +856,17 @@ def parse_api_datetime(value: str) -> Optional[datetime]:
         return None
 
 
+_SAFE_FILENAME_RE = re.compile(r"[A-Za-z0-9._-]+")
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
 def safe_filename(value: str) -> str:
     trimmed = value.strip()
+    # ERCOT constructed names are almost always clean already.
+    if _SAFE_FILENAME_RE.fullmatch(trimmed):
+        return trimmed
     trimmed = trimmed.replace("\\", "_").replace("/", "_")
-    return re.sub(r"[^A-Za-z0-9._-]+", "_", trimmed) or "ercot_document.bin"
+    return _UNSAFE_FILENAME_CHARS_RE.sub("_", trimmed) or "ercot_document.bin"
 
 
 def expected_size(metadata: Dict[str, object]) -> int:
@@ -564,17 +892,23 @@ def parse_retry_after_seconds(value: Optional[str]) -> float:
         return 0.0
 
 
+NAME_RESOLUTION_FAILURE_MARKERS = (
+    "nameresolutionerror",
+    "failed to resolve",
+    "nodename nor servname provided",
+    "temporary failure in name resolution",
+    "name or service not known",
+    "getaddrinfo failed",
+)
+# One alternation scans the message once instead of once per marker.
+_NAME_RESOLUTION_FAILURE_RE = re.compile(
+    "|".join(re.escape(marker) for marker in NAME_RESOLUTION_FAILURE_MARKERS),
+    re.IGNORECASE,
+)
+
+
 def is_name_resolution_failure(exc: BaseException) -> bool:
-    text = str(exc).lower()
-    markers = (
-        "nameresolutionerror",
-        "failed to resolve",
-        "nodename nor servname provided",
-        "temporary failure in name resolution",
-        "name or service not known",
-        "getaddrinfo failed",
-    )
-    return any(marker in text for marker in markers)
+    return _NAME_RESOLUTION_FAILURE_RE.search(str(exc)) is not None
 
 
 def extract_doc_id(doc: Dict[str, object]) -> str:
@@ -655,69 +989,109 @@ def append_doc_to_monthly_csv(
     monthly_path: Path,
     post_datetime: str = "",
 ) -> int:
-    csv_text = read_doc_csv_text(source_path)
-    if not csv_text.strip():
-        return 0
-    lines = csv_text.splitlines()
-    if not lines:
-        return 0
-    monthly_path.parent.mkdir(parents=True, exist_ok=True)
-    has_existing = monthly_path.exists() and monthly_path.stat().st_size > 0
-    existing_has_post_datetime = False
-    if has_existing:
-        with open(monthly_path, "r", encoding="utf-8", newline="") as handle:
-            existing_reader = csv.reader(handle)
-            existing_header = next(existing_reader, [])
-        existing_has_post_datetime = detect_post_datetime_column(existing_header) is not None
-
-    # Keep column alignment stable once monthly output has a postDateTime column,
-    # even when current archive metadata has blank postDatetime.
-    use_structured_append = bool(post_datetime) or existing_has_post_datetime
-    if use_structured_append:
-        reader = csv.DictReader(io.StringIO(csv_text))
-        if not reader.fieldnames:
-            return 0
-        source_fieldnames = list(reader.fieldnames)
-        rows = list(reader)
-        if not rows:
+    writer = MonthlyCsvWriter()
+    appended_rows = writer.append(source_path, monthly_path, post_datetime)
+    writer.flush()
+    return appended_rows
+
+
+class MonthlyCsvWriter:
+    """Append doc CSVs to monthly files, buffering the encoded rows and writing them in batches.
+
+    Each monthly file's header is read once and then tracked in memory, so later
+    appends neither reopen nor re-read the file.
+    """
+
+    def __init__(self, max_buffered_bytes: int = MONTHLY_APPEND_BUFFER_BYTES) -> None:
+        self.max_buffered_bytes = max(1, max_buffered_bytes)
+        # None: the file is empty or missing (after counting buffered text).
+        self.headers: Dict[Path, Optional[List[str]]] = {}
+        self.pending: Dict[Path, List[bytes]] = {}
+        self.pending_bytes = 0
+
+    def _header(self, monthly_path: Path) -> Optional[List[str]]:
+        if monthly_path in self.headers:
+            return self.headers[monthly_path]
+        monthly_path.parent.mkdir(parents=True, exist_ok=True)
+        header: Optional[List[str]] = None
+        if monthly_path.exists() and monthly_path.stat().st_size > 0:
+            with open(monthly_path, "r", encoding="utf-8", newline="") as handle:
+                header = next(csv.reader(handle), [])
+        self.headers[monthly_path] = header
+        return header
+
+    def _buffer(self, monthly_path: Path, text: str) -> None:
+        # Encoded up front so the flush threshold counts the bytes that reach disk.
+        data = text.encode("utf-8")
+        self.pending.setdefault(monthly_path, []).append(data)
+        self.pending_bytes += len(data)
+        if self.pending_bytes >= self.max_buffered_bytes:
+            self.flush()
+
+    def append(self, source_path: Path, monthly_path: Path, post_datetime: str = "") -> int:
+        csv_text = read_doc_csv_text(source_path)
+        if not csv_text.strip():
             return 0
-
-        source_posting_col = detect_post_datetime_column(source_fieldnames)
-        target_posting_col = POST_DATETIME_COLUMN
-        target_fieldnames: List[str]
-
-        if has_existing:
-            # Existing monthly files from older runs may not have postDateTime.
-            # Upgrade once so all future appends use a stable schema.
-            existing_fieldnames = migrate_monthly_csv_add_post_datetime(monthly_path)
-            if existing_fieldnames:
-                target_fieldnames = existing_fieldnames
-                existing_posting_col = detect_post_datetime_column(existing_fieldnames)
-                if existing_posting_col:
-                    target_posting_col = existing_posting_col
+        header = self._header(monthly_path)
+        has_existing = header is not None
+        existing_has_post_datetime = has_existing and detect_post_datetime_column(header) is not None
+
+        # Keep column alignment stable once monthly output has a postDateTime column,
+        # even when current archive metadata has blank postDatetime.
+        use_structured_append = bool(post_datetime) or existing_has_post_datetime
+        if use_structured_append:
+            reader = csv.DictReader(io.StringIO(csv_text))
+            if not reader.fieldnames:
+                return 0
+            source_fieldnames = list(reader.fieldnames)
+            # Rows are rewritten as they are parsed; only the first is read ahead so an
+            # empty doc returns before any header migration.
+            first_row = next(reader, None)
+            if first_row is None:
+                return 0
+
+            source_posting_col = detect_post_datetime_column(source_fieldnames)
+            target_posting_col = POST_DATETIME_COLUMN
+            target_fieldnames: List[str]
+
+            if has_existing:
+                existing_fieldnames = header
+                if header and not existing_has_post_datetime:
+                    # Existing monthly files from older runs may not have postDateTime.
+                    # Upgrade once so all future appends use a stable schema.
+                    self.flush(monthly_path)
+                    existing_fieldnames = migrate_monthly_csv_add_post_datetime(monthly_path)
+                    self.headers[monthly_path] = existing_fieldnames
+                if existing_fieldnames:
+                    target_fieldnames = existing_fieldnames
+                    existing_posting_col = detect_post_datetime_column(existing_fieldnames)
+                    if existing_posting_col:
+                        target_posting_col = existing_posting_col
+                    else:
+                        target_fieldnames = [target_posting_col] + existing_fieldnames
                 else:
-                    target_fieldnames = [target_posting_col] + existing_fieldnames
-            else:
-                has_existing = False
+                    has_existing = False
 
-        if not has_existing:
-            excluded = {target_posting_col}
-            if source_posting_col and source_posting_col != target_posting_col:
-                excluded.add(source_posting_col)
-            target_fieldnames = [target_posting_col] + [
-                name for name in source_fieldnames if name not in excluded
-            ]
+            if not has_existing:
+                excluded = {target_posting_col}
+                if source_posting_col and source_posting_col != target_posting_col:
+                    excluded.add(source_posting_col)
+                target_fieldnames = [target_posting_col] + [
+                    name for name in source_fieldnames if name not in excluded
+                ]
 
-        with open(monthly_path, "a", encoding="utf-8", newline="") as handle:
+            out = io.StringIO()
             writer = csv.DictWriter(
-                handle,
+                out,
                 fieldnames=target_fieldnames,
                 extrasaction="ignore",
                 lineterminator="\n",
             )
             if not has_existing:
                 writer.writeheader()
-            for row in rows:
+            row_count = 0
+            for row in chain((first_row,), reader):
+                row_count += 1
                 if source_posting_col and source_posting_col != target_posting_col:
                     source_value = str(row.get(source_posting_col) or "").strip()
                     row[target_posting_col] = source_value or post_datetime
@@ -728,16 +1102,46 @@ def append_doc_to_monthly_csv(
                 else:
                     row[target_posting_col] = post_datetime
                 writer.writerow(row)
-        return len(rows)
+            if header is None:
+                self.headers[monthly_path] = target_fieldnames
+            self._buffer(monthly_path, out.getvalue())
+            return row_count
+
+        # Legacy path: raw line copy when no postDateTime is available in archive metadata.
+        text = csv_text.replace("\r\n", "\n").replace("\r", "\n")
+        start = 0
+        if has_existing:
+            start = text.find("\n") + 1
+            if not start:
+                return 0
+        if start >= len(text):
+            return 0
+        line_count = text.count("\n", start)
+        if not text.endswith("\n"):
+            text += "\n"
+            line_count += 1
+        if header is None:
+            self.headers[monthly_path] = next(csv.reader(io.StringIO(text)), [])
+        self._buffer(monthly_path, text[start:] if start else text)
+        return line_count
+
+    def flush(self, monthly_path: Optional[Path] = None) -> None:
+        paths = list(self.pending) if monthly_path is None else [monthly_path]
+        for path in paths:
+            chunks = self.pending.get(path)
+            if not chunks:
+                continue
+            # Buffered chunks are already LF-normalized UTF-8 CSV, so no TextIOWrapper
+            # sits in between.
+            with open(path, "ab") as handle:
+                handle.writelines(chunks)
+            del self.pending[path]
+            self.pending_bytes -= sum(map(len, chunks))
 
-    # Legacy path: raw line copy when no postDateTime is available in archive metadata.
-    payload = lines[1:] if has_existing else lines
-    if not payload:
-        return 0
-    with open(monthly_path, "a", encoding="utf-8", newline="\n") as handle:
-        handle.write("\n".join(payload))
-        handle.write("\n")
-    return len(payload)
+    def release(self) -> None:
+        """Flush everything and forget cached headers (the files may be rewritten next)."""
+        self.flush()
+        self.headers.clear()
 
 
 def authenticate(
@@ -786,6 +1190,30 @@ def authenticate(
     return token
 
 
+def decode_json_response(response: requests.Response) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN and >64-bit ints that stdlib json accepts.
+            pass
+    return response.json()
+
+
+def bearer_token_expires_at(token: str) -> Optional[float]:
+    """Return the JWT ``exp`` claim as a ``time.monotonic()`` deadline, or None if absent."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        encoded = parts[1] + "=" * (-len(parts[1]) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(encoded))
+        exp = float(claims["exp"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return time.monotonic() + (exp - time.time())
+
+
 def _find_first_list_of_dicts(payload: object) -> Optional[List[Dict[str, object]]]:
     if isinstance(payload, list):
         rows = [row for row in payload if isinstance(row, dict)]
@@ -864,6 +1292,30 @@ def coerce_list(payload: object) -> List[Dict[str, object]]:
     raise RuntimeError("Unexpected API response shape. No list of objects was found.")
 
 
+class RequestRateLimiter:
+    """Thread-safe token bucket: ``rate`` requests per second with bursts of up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = max(0.0, rate)
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            # Going negative reserves a future slot, so waiters sleep outside the lock.
+            self._tokens -= 1.0
+            wait_seconds = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+
 class ErcotPublicReportsClient:
     def __init__(
         self,
@@ -874,14 +1326,30 @@ class ErcotPublicReportsClient:
         retry_sleep_seconds: float,
         request_interval_seconds: float,
         reauth_config: Optional[Dict[str, object]] = None,
+        pool_size: int = HTTP_POOL_SIZE,
+        requests_per_second: Optional[float] = None,
+        request_burst: int = 1,
     ) -> None:
         self.timeout_seconds = timeout_seconds
         self.max_retries = max_retries
         self.retry_sleep_seconds = retry_sleep_seconds
         self.request_interval_seconds = max(0.0, request_interval_seconds)
-        self.next_request_at = 0.0
+        if requests_per_second is None:
+            requests_per_second = 1.0 / self.request_interval_seconds if self.request_interval_seconds > 0 else 0.0
+        # Shared by worker threads; a rate of 0 disables pacing.
+        self.rate_limiter = RequestRateLimiter(requests_per_second, request_burst)
         self.reauth_config = reauth_config
+        self._reauth_kwargs = self._resolve_reauth_kwargs(reauth_config)
+        # Serializes token refreshes; the generation lets 401 handlers skip a refresh
+        # another thread already completed.
+        self._auth_lock = threading.Lock()
+        self._token_generation = 0
+        self._token_expires_at = bearer_token_expires_at(bearer_token)
         self.session = requests.Session()
+        # Size the keep-alive pool for worker threads. Retries stay in _request so
+        # every attempt passes the rate limiter.
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
         # Keep headers minimal. For archive downloads, default Requests negotiation
         # is more robust than forcing Accept/User-Agent values.
         self.session.headers.update(
@@ -891,28 +1359,45 @@ class ErcotPublicReportsClient:
             }
         )
 
-    def _refresh_bearer_token(self) -> bool:
-        if not self.reauth_config:
-            return False
-        username = str(self.reauth_config.get("username", ""))
-        password = str(self.reauth_config.get("password", ""))
-        client_id = str(self.reauth_config.get("client_id", ""))
-        scope = str(self.reauth_config.get("scope", ""))
-        token_url = str(self.reauth_config.get("token_url", ""))
-        timeout_seconds = int(self.reauth_config.get("timeout_seconds", self.timeout_seconds))
-        if not all((username, password, client_id, scope, token_url)):
+    def _resolve_reauth_kwargs(self, reauth_config: Optional[Dict[str, object]]) -> Optional[Dict[str, Any]]:
+        if not reauth_config:
+            return None
+        kwargs: Dict[str, Any] = {
+            key: str(reauth_config.get(key, ""))
+            for key in ("username", "password", "client_id", "scope", "token_url")
+        }
+        if not all(kwargs.values()):
+            return None
+        kwargs["timeout_seconds"] = int(reauth_config.get("timeout_seconds", self.timeout_seconds))
+        return kwargs
+
+    def _refresh_bearer_token(self, stale_generation: Optional[int] = None) -> bool:
+        if self._reauth_kwargs is None:
             return False
-        token = authenticate(
-            username=username,
-            password=password,
-            client_id=client_id,
-            scope=scope,
-            token_url=token_url,
-            timeout_seconds=timeout_seconds,
-        )
-        self.session.headers["Authorization"] = f"Bearer {token}"
+        with self._auth_lock:
+            if stale_generation is not None and stale_generation != self._token_generation:
+                return True
+            token = authenticate(**self._reauth_kwargs)
+            self.session.headers["Authorization"] = f"Bearer {token}"
+            self._token_expires_at = bearer_token_expires_at(token)
+            self._token_generation += 1
         return True
 
+    def _refresh_token_if_expiring(self) -> None:
+        expires_at = self._token_expires_at
+        if expires_at is None or self._reauth_kwargs is None:
+            return
+        if time.monotonic() < expires_at - TOKEN_REFRESH_MARGIN_SECONDS:
+            return
+        generation = self._token_generation
+        try:
+            self._refresh_bearer_token(stale_generation=generation)
+        except Exception:  # noqa: BLE001
+            # Keep the current token; the 401 handler in _request still covers expiry.
+            with self._auth_lock:
+                if self._token_generation == generation:
+                    self._token_expires_at = None
+
     def _request(
         self,
         method: str,
@@ -921,13 +1406,14 @@ class ErcotPublicReportsClient:
         stream: bool = False,
         **kwargs: object,
     ) -> requests.Response:
+        # Every attempt, including retries of 429/5xx and transport failures, waits
+        # on the shared rate limiter and then backs off linearly.
         refreshed_auth = False
         for attempt in range(1, self.max_retries + 1):
+            self._refresh_token_if_expiring()
+            token_generation = self._token_generation
+            self.rate_limiter.acquire()
             try:
-                if self.request_interval_seconds > 0:
-                    now = time.monotonic()
-                    if now < self.next_request_at:
-                        time.sleep(self.next_request_at - now)
                 response = self.session.request(
                     method,
                     url,
@@ -935,28 +1421,28 @@ class ErcotPublicReportsClient:
                     stream=stream,
                     **kwargs,
                 )
-                self.next_request_at = time.monotonic() + self.request_interval_seconds
-                if response.status_code == 401 and attempt < self.max_retries and not refreshed_auth:
-                    response.close()
-                    if self._refresh_bearer_token():
-                        refreshed_auth = True
-                        continue
-                if response.status_code in (429, 500, 502, 503, 504) and attempt < self.max_retries:
-                    retry_after = parse_retry_after_seconds(response.headers.get("Retry-After"))
-                    response.close()
-                    time.sleep(max(self.retry_sleep_seconds * attempt, retry_after))
-                    continue
-                response.raise_for_status()
-                return response
-            except requests.RequestException:
+            except TRANSIENT_REQUEST_ERRORS:
                 if attempt >= self.max_retries:
                     raise
                 time.sleep(self.retry_sleep_seconds * attempt)
+                continue
+            if response.status_code == 401 and attempt < self.max_retries and not refreshed_auth:
+                response.close()
+                if self._refresh_bearer_token(stale_generation=token_generation):
+                    refreshed_auth = True
+                    continue
+            if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                retry_after = parse_retry_after_seconds(response.headers.get("Retry-After"))
+                response.close()
+                time.sleep(max(self.retry_sleep_seconds * attempt, retry_after))
+                continue
+            response.raise_for_status()
+            return response
         raise RuntimeError("Retry loop exhausted unexpectedly.")
 
     def list_public_reports(self) -> List[Dict[str, object]]:
-        response = self._request("GET", API_BASE_URL)
-        return coerce_list(response.json())
+        response = self._request("GET", API_BASE_URL, headers={"Accept-Encoding": LISTING_ACCEPT_ENCODING})
+        return coerce_list(decode_json_response(response))
 
     def iter_archive_docs(
         self,
@@ -999,8 +1485,9 @@ class ErcotPublicReportsClient:
                 "size": page_size,
                 "page": page,
             },
+            headers={"Accept-Encoding": LISTING_ACCEPT_ENCODING},
         )
-        return coerce_list(response.json())
+        return coerce_list(decode_json_response(response))
 
     def download_doc(
         self,
@@ -1020,10 +1507,10 @@ class ErcotPublicReportsClient:
                     params=params,
                     stream=True,
                 ) as response:
-                    with open(tmp_path, "wb") as handle:
-                        for chunk in response.iter_content(chunk_size=1024 * 1024):
-                            if chunk:
-                                handle.write(chunk)
+                    # Let urllib3 decode gzip/deflate and copy in C-sized blocks.
+                    response.raw.decode_content = True
+                    with open(tmp_path, "wb", buffering=0) as handle:
+                        shutil.copyfileobj(response.raw, handle, length=1024 * 1024)
                 tmp_path.replace(destination)
                 return
             except requests.HTTPError as exc:
@@ -1042,26 +1529,74 @@ class ErcotPublicReportsClient:
     ) -> Dict[str, bytes]:
         """Bulk-download multiple docs via a single POST request.
 
-        When *strict_count* is True (default, used by the main downloader) the
-        method raises if the response does not contain exactly the requested
-        number of documents.  Pass ``strict_count=False`` for recovery/backfill
-        callers that want to accept a partial response gracefully.
+        When *strict_count* is True (default) the method raises if the response
+        does not contain exactly the requested number of documents.  Pass
+        ``strict_count=False`` to accept a partial response gracefully; the main
+        downloader and backfill do this and fetch missing docs individually.
+        """
+        return dict(self.iter_download_docs(report_id, doc_ids, strict_count=strict_count))
+
+    def iter_download_docs(
+        self,
+        report_id: str,
+        doc_ids: List[str],
+        strict_count: bool = True,
+    ) -> Iterator[Tuple[str, bytes]]:
+        """Like ``download_docs`` but yield ``(doc_id, content)`` pairs one at a time.
+
+        The POST and the outer count check run before this returns; the response
+        is spooled to a temporary file (on disk once it exceeds
+        BULK_SPOOL_MAX_BYTES) and nested ZIPs are unpacked lazily.
         """
-        ret: Dict[str, bytes] = {}
         url = f"https://api.ercot.com/api/public-reports/archive/{report_id}/download"
-        with self._request(
-            "POST",
-            url,
-            json={"docIds": doc_ids},
-        ) as response:
-            unzipped = extract_zip_from_memory(response.content)
-            if strict_count and len(unzipped) != len(doc_ids):
+        spool = tempfile.SpooledTemporaryFile(max_size=BULK_SPOOL_MAX_BYTES)
+        try:
+            attempts = max(1, self.max_retries)
+            for attempt in range(1, attempts + 1):
+                with self._request(
+                    "POST",
+                    url,
+                    json={"docIds": doc_ids},
+                    stream=True,
+                ) as response:
+                    try:
+                        for chunk in response.iter_content(chunk_size=1024 * 1024):
+                            if chunk:
+                                spool.write(chunk)
+                        break
+                    except TRANSIENT_REQUEST_ERRORS:
+                        if attempt >= attempts:
+                            raise
+                # The body was cut off mid-read: drop the partial spool and POST again.
+                spool.seek(0)
+                spool.truncate()
+                time.sleep(self.retry_sleep_seconds * attempt)
+            spool.seek(0)
+            archive = zipfile.ZipFile(spool)
+            # Duplicate member names collapse to one entry, as a dict of members would.
+            filenames = list(dict.fromkeys(archive.namelist()))
+            if strict_count and len(filenames) != len(doc_ids):
+                archive.close()
                 raise RuntimeError(
                     "Bulk response count mismatch: "
-                    f"requested={len(doc_ids)} returned={len(unzipped)}."
+                    f"requested={len(doc_ids)} returned={len(filenames)}."
                 )
-            for filename, zipped_doc in unzipped.items():
+        except BaseException:
+            spool.close()
+            raise
+        return self._iter_bulk_members(archive, spool, filenames, strict_count)
+
+    @staticmethod
+    def _iter_bulk_members(
+        archive: zipfile.ZipFile,
+        spool: IO[bytes],
+        filenames: List[str],
+        strict_count: bool,
+    ) -> Iterator[Tuple[str, bytes]]:
+        try:
+            for filename in filenames:
                 doc_id = filename.split(".", 1)[0]
+                zipped_doc = archive.read(filename)
                 try:
                     inner_unzipped = extract_zip_from_memory(zipped_doc)
                 except Exception:
@@ -1076,9 +1611,10 @@ class ErcotPublicReportsClient:
                         )
                     if not inner_unzipped:
                         continue
-                doc_content = list(inner_unzipped.items())[0][1]
-                ret[doc_id] = doc_content
-        return ret
+                yield doc_id, next(iter(inner_unzipped.values()))
+        finally:
+            archive.close()
+            spool.close()
 
 
 def choose_filename(doc: Dict[str, object]) -> str:
@@ -1133,26 +1669,130 @@ def monthly_csv_in_window(path: Path, dataset_root: Path, window_start: date, wi
     return window_month_start <= month_start <= window_month_end
 
 
+def filter_monthly_csvs(
+    paths: Iterable[Path], dataset_root: Path, window_start: date, window_end: date
+) -> List[Path]:
+    """Batch form of monthly_csv_in_window for large directory walks."""
+    # Compare year*100+month keys on the raw path text; this skips the
+    # relative_to/parts/date() work per file.
+    window_low = window_start.year * 100 + window_start.month
+    window_high = window_end.year * 100 + window_end.month
+    root_prefix = str(dataset_root).rstrip(os.sep) + os.sep
+    selected: List[Path] = []
+    for path in paths:
+        text = str(path)
+        if text.startswith(root_prefix):
+            parts = text[len(root_prefix) :].split(os.sep)
+        else:
+            try:
+                parts = list(path.relative_to(dataset_root).parts)
+            except ValueError:
+                continue
+        if len(parts) < 3:
+            continue
+        year_text, month_text = parts[0], parts[1]
+        if not (year_text.isdigit() and month_text.isdigit()):
+            continue
+        month = int(month_text)
+        if month < 1 or month > 12:
+            continue
+        if window_low <= int(year_text) * 100 + month <= window_high:
+            selected.append(path)
+    return selected
+
+
+def _scandir_subdirs(folder: str) -> List[os.DirEntry]:
+    # Real (non-symlinked) subdirectories, as pathlib's "**" recursion sees them.
+    try:
+        with os.scandir(folder) as entries:
+            return [entry for entry in entries if entry.is_dir() and not entry.is_symlink()]
+    except OSError:
+        return []
+
+
+def iter_monthly_csv_files_in_window(dataset_root: Path, window_start: date, window_end: date) -> Iterator[Path]:
+    """Yield CSV files under <year>/<month>/ folders inside the window.
+
+    Selects the same files as filter_monthly_csvs over dataset_root.glob("**/*.csv")
+    plus an is_file() check, but never descends into out-of-window year/month folders
+    and takes file types from the directory entries instead of extra stat calls.
+    """
+    window_low = window_start.year * 100 + window_start.month
+    window_high = window_end.year * 100 + window_end.month
+    for year_entry in _scandir_subdirs(str(dataset_root)):
+        if not year_entry.name.isdigit():
+            continue
+        year = int(year_entry.name)
+        if not window_start.year <= year <= window_end.year:
+            continue
+        for month_entry in _scandir_subdirs(year_entry.path):
+            if not month_entry.name.isdigit():
+                continue
+            month = int(month_entry.name)
+            if month < 1 or month > 12 or not window_low <= year * 100 + month <= window_high:
+                continue
+            pending = [month_entry.path]
+            while pending:
+                folder = pending.pop()
+                try:
+                    with os.scandir(folder) as entries:
+                        folder_entries = list(entries)
+                except OSError:
+                    continue
+                for entry in folder_entries:
+                    try:
+                        if os.path.normcase(entry.name).endswith(".csv") and entry.is_file():
+                            yield Path(entry.path)
+                        elif entry.is_dir() and not entry.is_symlink():
+                            pending.append(entry.path)
+                    except OSError:
+                        continue
+
+
 def marker_path_for_monthly(monthly_path: Path) -> Path:
     return monthly_path.with_suffix(monthly_path.suffix + ".docids")
 
 
 def load_marker_doc_ids(marker_path: Path) -> Set[str]:
-    if not marker_path.exists():
+    try:
+        data = marker_path.read_bytes()
+    except FileNotFoundError:
         return set()
-    doc_ids = set()
-    with open(marker_path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            value = line.strip()
-            if value:
-                doc_ids.add(value)
+    # One read, one decode and one split; str.strip also drops any "\r" from CRLF edits.
+    doc_ids = set(map(str.strip, data.decode("utf-8").split("\n")))
+    doc_ids.discard("")
     return doc_ids
 
 
-def append_marker_doc_id(marker_path: Path, doc_id: str) -> None:
-    marker_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(marker_path, "a", encoding="utf-8") as handle:
-        handle.write(f"{doc_id}\n")
+class MarkerWriter:
+    """Buffer consolidated doc IDs and append them to marker files in batches."""
+
+    def __init__(
+        self,
+        every: int = MARKER_FLUSH_EVERY,
+        before_flush: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.every = max(1, every)
+        self.before_flush = before_flush
+        self.pending: Dict[Path, List[str]] = {}
+        self.count = 0
+
+    def add(self, marker_path: Path, doc_id: str) -> None:
+        self.pending.setdefault(marker_path, []).append(doc_id)
+        self.count += 1
+        if self.count >= self.every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.before_flush is not None:
+            self.before_flush()
+        while self.pending:
+            marker_path, doc_ids = next(iter(self.pending.items()))
+            marker_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(marker_path, "a", encoding="utf-8") as handle:
+                handle.write("\n".join(doc_ids) + "\n")
+            del self.pending[marker_path]
+        self.count = 0
 
 
 def maybe_href(doc: Dict[str, object], rel: str) -> Optional[str]:
@@ -1181,19 +1821,28 @@ def maybe_product_archive_href(product: Dict[str, object]) -> Optional[str]:
     return None
 
 
+def dataset_archive_url(dataset_id: str, product: Dict[str, object]) -> str:
+    return maybe_product_archive_href(product) or f"{API_BASE_URL}/archive/{dataset_id.lower()}"
+
+
+@lru_cache(maxsize=4096)
+def _href_query_keys(href: str) -> frozenset:
+    return frozenset(key.lower() for key in parse_qs(urlparse(href).query))
+
+
 def build_download_candidates(
     report_id: str,
     doc_id: str,
     archive_doc: Dict[str, object],
 ) -> List[Tuple[str, Optional[Dict[str, str]]]]:
     candidates: List[Tuple[str, Optional[Dict[str, str]]]] = []
+    seen_hrefs: Set[str] = set()
     for rel in ("download", "file", "endpoint", "self"):
         href = maybe_href(archive_doc, rel)
-        if not href:
+        if not href or href in seen_hrefs:
             continue
-        parsed = urlparse(href)
-        query_keys = {key.lower() for key in parse_qs(parsed.query).keys()}
-        if {"docid", "doclookupid", "download"} & query_keys:
+        seen_hrefs.add(href)
+        if not _href_query_keys(href).isdisjoint(("docid", "doclookupid", "download")):
             candidates.append((href, None))
             continue
         candidates.append((href, {"docId": doc_id}))
@@ -1209,7 +1858,7 @@ def build_download_candidates(
     deduped: List[Tuple[str, Optional[Dict[str, str]]]] = []
     seen = set()
     for url, params in candidates:
-        key = (url, tuple(sorted((params or {}).items())))
+        key = (url, frozenset(params.items()) if params else None)
         if key in seen:
             continue
         seen.add(key)
@@ -1217,21 +1866,135 @@ def build_download_candidates(
     return deduped
 
 
+@lru_cache(maxsize=4096)
+def _month_subdir(year: int, month: int) -> Path:
+    return Path(f"{year:04d}") / f"{month:02d}"
+
+
 def dataset_subdir_from_doc(doc: Dict[str, object]) -> Path:
-    parsed = parse_api_datetime(str(doc.get("postDatetime", "")).strip())
+    return _subdir_from_post_datetime(str(doc.get("postDatetime") or ""))
+
+
+def _subdir_from_post_datetime(post_datetime: str) -> Path:
+    parsed = parse_api_datetime(post_datetime.strip())
     if parsed is None:
         return Path("undated")
-    return Path(parsed.strftime("%Y")) / parsed.strftime("%m")
+    return _month_subdir(parsed.year, parsed.month)
+
+
+@lru_cache(maxsize=4096)
+def _stampdate_date_and_day(stampdate: str) -> Tuple[str, int]:
+    # Many docs share a postDatetime, so file-timing output parses each stampdate once.
+    parsed = parse_api_datetime(stampdate)
+    if parsed is not None:
+        return parsed.date().isoformat(), parsed.day
+    if "T" in stampdate:
+        stampdate_date = stampdate.split("T", 1)[0]
+        try:
+            return stampdate_date, int(stampdate_date.split("-")[2])
+        except Exception:  # noqa: BLE001
+            return stampdate_date, -1
+    return "-", -1
+
+
+@dataclass(frozen=True, slots=True)
+class DocTarget:
+    """Per-doc output paths and listing fields, derived once per dataset pass."""
+
+    doc_id: str
+    filename: str
+    subdir: Path
+    destination: Path
+    monthly_path: Path
+    marker_path: Path
+    wanted_size: int
+    post_datetime: str
+    archive_page: int
+
+
+# (doc IDs to request, docs without an ID, chunk docs grouped by ID)
+BulkChunkCandidates = Tuple[List[str], int, Dict[str, List[Dict[str, Any]]]]
+
+
+@lru_cache(maxsize=4096)
+def _doc_target_dirs(outdir: Path, dataset_id: str, subdir: Path) -> Tuple[Path, Path, Path]:
+    monthly_path = monthly_csv_path(outdir, dataset_id, subdir)
+    return outdir / dataset_id / subdir, monthly_path, marker_path_for_monthly(monthly_path)
+
+
+def doc_target(outdir: Path, dataset_id: str, doc: Dict[str, object]) -> Optional[DocTarget]:
+    doc_id = extract_doc_id(doc)
+    if not doc_id:
+        return None
+    filename = with_doc_id_suffix(choose_filename(doc), doc_id)
+    post_datetime = str(doc.get("postDatetime") or "")
+    subdir = _subdir_from_post_datetime(post_datetime)
+    # Docs in the same month share one set of directory/monthly/marker paths.
+    folder, monthly_path, marker_path = _doc_target_dirs(outdir, dataset_id, subdir)
+    return DocTarget(
+        doc_id=doc_id,
+        filename=filename,
+        subdir=subdir,
+        destination=folder / filename,
+        monthly_path=monthly_path,
+        marker_path=marker_path,
+        wanted_size=expected_size(doc),
+        post_datetime=post_datetime,
+        archive_page=_safe_int(doc.get("__archive_page"), 0),
+    )
+
+
+def scan_file_sizes(folder: Path) -> Dict[str, int]:
+    """Map file name -> size for one directory (empty when it does not exist)."""
+    sizes: Dict[str, int] = {}
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        sizes[entry.name] = entry.stat().st_size
+                except OSError:
+                    continue
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return sizes
+
+
+def remove_partial_downloads(folders: Iterable[Path]) -> int:
+    """Delete leftover ``*.part`` files from interrupted downloads in *folders*.
+
+    Downloads write their ``.part`` file next to the destination, so only the
+    folders themselves are scanned, not their subfolders.
+    """
+    removed = 0
+    for folder in folders:
+        try:
+            with os.scandir(folder) as entries:
+                part_paths = [entry.path for entry in entries if entry.name.endswith(".part")]
+        except OSError:
+            continue
+        for part_path in part_paths:
+            try:
+                os.unlink(part_path)
+            except FileNotFoundError:
+                continue
+            removed += 1
+    return removed
 
 
 def maybe_extract_zip(path: Path) -> None:
     if path.suffix.lower() != ".zip":
         return
-    target_dir = path.parent.resolve()
     with zipfile.ZipFile(path, "r") as archive:
         for member in archive.namelist():
-            member_resolved = (target_dir / member).resolve()
-            if not str(member_resolved).startswith(str(target_dir) + os.sep) and member_resolved != target_dir:
+            # Lexical check only: no realpath() syscalls per member.
+            normalized = os.path.normpath(member)
+            if (
+                os.path.isabs(normalized)
+                or os.path.splitdrive(normalized)[0]
+                or normalized == os.pardir
+                or normalized.startswith(os.pardir + os.sep)
+            ):
                 raise RuntimeError(
                     f"ZIP path traversal rejected: member {member!r} resolves outside target directory."
                 )
@@ -1259,47 +2022,63 @@ def list_archive_docs_with_retries(
     start_page: int = 1,
     seed_docs: Optional[List[Dict[str, Any]]] = None,
     on_page_listed: Optional[Callable[[int, List[Dict[str, Any]], int], None]] = None,
+    lookahead_pages: int = 1,
 ) -> List[Dict[str, object]]:
     docs: List[Dict[str, object]] = list(seed_docs or [])
-    page = max(1, start_page)
-    _list_pbar = tqdm(desc=f"Listing {dataset_id}", unit="page", leave=False)
-    try:
+
+    def fetch_page(page: int) -> List[Dict[str, object]]:
+        listing_attempt = 0
         while True:
-            listing_attempt = 0
-            while True:
-                try:
-                    rows = client.list_archive_page(
-                        archive_url=archive_url,
-                        post_datetime_from=post_datetime_from,
-                        post_datetime_to=post_datetime_to,
-                        page_size=page_size,
+            try:
+                return client.list_archive_page(
+                    archive_url=archive_url,
+                    post_datetime_from=post_datetime_from,
+                    post_datetime_to=post_datetime_to,
+                    page_size=page_size,
+                    page=page,
+                )
+            except requests.HTTPError as exc:
+                status = exc.response.status_code if exc.response is not None else None
+                if status == 429 and listing_attempt < archive_listing_retries:
+                    listing_attempt += 1
+                    retry_after = (
+                        parse_retry_after_seconds(exc.response.headers.get("Retry-After"))
+                        if exc.response is not None
+                        else 0.0
+                    )
+                    cooldown_seconds = max(
+                        retry_after,
+                        retry_sleep_seconds * (2 ** listing_attempt),
+                    )
+                    log_event(
+                        "ARCHIVE_LISTING_RETRY",
+                        dataset=dataset_id,
                         page=page,
+                        attempt=f"{listing_attempt}/{archive_listing_retries}",
+                        sleep_seconds=f"{cooldown_seconds:.1f}",
+                        reason="http_429",
                     )
-                    break
-                except requests.HTTPError as exc:
-                    status = exc.response.status_code if exc.response is not None else None
-                    if status == 429 and listing_attempt < archive_listing_retries:
-                        listing_attempt += 1
-                        retry_after = (
-                            parse_retry_after_seconds(exc.response.headers.get("Retry-After"))
-                            if exc.response is not None
-                            else 0.0
-                        )
-                        cooldown_seconds = max(
-                            retry_after,
-                            retry_sleep_seconds * (2 ** listing_attempt),
-                        )
-                        log_event(
-                            "ARCHIVE_LISTING_RETRY",
-                            dataset=dataset_id,
-                            page=page,
-                            attempt=f"{listing_attempt}/{archive_listing_retries}",
-                            sleep_seconds=f"{cooldown_seconds:.1f}",
-                            reason="http_429",
-                        )
-                        time.sleep(cooldown_seconds)
-                        continue
-                    raise
+                    time.sleep(cooldown_seconds)
+                    continue
+                raise
+
+    # Pages are fetched up to lookahead_pages ahead but consumed strictly in order,
+    # so callbacks, the docs order and the stop-at-short-page rule stay sequential.
+    lookahead_pages = max(1, lookahead_pages)
+    pool = ThreadPoolExecutor(max_workers=lookahead_pages) if lookahead_pages > 1 else None
+    in_flight: Dict[int, Any] = {}
+    next_to_submit = max(1, start_page)
+    page = next_to_submit
+    _list_pbar = progress_bar(desc=f"Listing {dataset_id}", unit="page", leave=False)
+    try:
+        while True:
+            if pool is None:
+                rows = fetch_page(page)
+            else:
+                while next_to_submit < page + lookahead_pages:
+                    in_flight[next_to_submit] = pool.submit(fetch_page, next_to_submit)
+                    next_to_submit += 1
+                rows = in_flight.pop(page).result()
 
             if not rows:
                 break
@@ -1325,6 +2104,10 @@ def list_archive_docs_with_retries(
             page += 1
     finally:
         _list_pbar.close()
+        if pool is not None:
+            for future in in_flight.values():
+                future.cancel()
+            pool.shutdown(wait=True)
     return docs
 
 
@@ -1336,6 +2119,7 @@ def archive_window_has_docs(
     window_end: date,
     archive_listing_retries: int,
     retry_sleep_seconds: float,
+    stop_event: Optional[threading.Event] = None,
 ) -> bool:
     post_datetime_from = to_start_iso(window_start)
     post_datetime_to = to_end_iso(window_end)
@@ -1370,7 +2154,11 @@ def archive_window_has_docs(
                     sleep_seconds=f"{cooldown_seconds:.1f}",
                     reason="http_429",
                 )
-                time.sleep(cooldown_seconds)
+                if stop_event is None:
+                    time.sleep(cooldown_seconds)
+                elif stop_event.wait(cooldown_seconds):
+                    # Abandoned probe; the caller discards the answer.
+                    return False
                 continue
             raise
 
@@ -1383,65 +2171,44 @@ def find_earliest_available_date(
     search_to: date,
     archive_listing_retries: int,
     retry_sleep_seconds: float,
+    stop_event: Optional[threading.Event] = None,
 ) -> Optional[date]:
     if search_from > search_to:
         return None
 
-    # Probe earliest availability from coarse to fine: year, then month, then day.
-    for year in range(search_from.year, search_to.year + 1):
-        year_start = max(search_from, date(year, 1, 1))
-        year_end = min(search_to, date(year, 12, 31))
-        if year_start > year_end:
-            continue
-        if not archive_window_has_docs(
+    # A set stop_event abandons the search between listing requests; the None it
+    # then returns is meaningless and discarded by the caller.
+    def stopped() -> bool:
+        return stop_event is not None and stop_event.is_set()
+
+    def window_has_docs(window_end: date) -> bool:
+        return archive_window_has_docs(
             client=client,
             archive_url=archive_url,
             dataset_id=dataset_id,
-            window_start=year_start,
-            window_end=year_end,
+            window_start=search_from,
+            window_end=window_end,
             archive_listing_retries=archive_listing_retries,
             retry_sleep_seconds=retry_sleep_seconds,
-        ):
-            continue
-
-        for month in range(year_start.month, year_end.month + 1):
-            month_start = max(year_start, date(year, month, 1))
-            month_last_day = calendar.monthrange(year, month)[1]
-            month_end = min(year_end, date(year, month, month_last_day))
-            if month_start > month_end:
-                continue
-            if not archive_window_has_docs(
-                client=client,
-                archive_url=archive_url,
-                dataset_id=dataset_id,
-                window_start=month_start,
-                window_end=month_end,
-                archive_listing_retries=archive_listing_retries,
-                retry_sleep_seconds=retry_sleep_seconds,
-            ):
-                continue
-
-            day_count = (month_end - month_start).days + 1
-            for offset in range(day_count):
-                day = month_start + timedelta(days=offset)
-                if archive_window_has_docs(
-                    client=client,
-                    archive_url=archive_url,
-                    dataset_id=dataset_id,
-                    window_start=day,
-                    window_end=day,
-                    archive_listing_retries=archive_listing_retries,
-                    retry_sleep_seconds=retry_sleep_seconds,
-                ):
-                    return day
-
-            # Fallback: month-level probe succeeded but no day-level hit was found.
-            return month_start
+            stop_event=stop_event,
+        )
 
-        # Fallback: year-level probe succeeded but no month-level hit was found.
-        return year_start
+    if not window_has_docs(search_to):
+        return None
 
-    return None
+    # "[search_from, day] has docs" is monotone in day, so bisect for the first day
+    # where it turns true: ~log2(days) probes instead of walking years/months/days.
+    lo = 0
+    hi = (search_to - search_from).days
+    while lo < hi:
+        if stopped():
+            return None
+        mid = (lo + hi) // 2
+        if window_has_docs(search_from + timedelta(days=mid)):
+            hi = mid
+        else:
+            lo = mid + 1
+    return search_from + timedelta(days=lo)
 
 
 def doc_post_datetime_for_sort(doc: Dict[str, object]) -> Optional[datetime]:
@@ -1456,31 +2223,73 @@ def doc_post_datetime_for_sort(doc: Dict[str, object]) -> Optional[datetime]:
 def order_archive_docs(docs: List[Dict[str, object]], order: str) -> List[Dict[str, object]]:
     if order == "api":
         return docs
+    if order not in {"newest-first", "oldest-first"}:
+        raise ValueError(f"Unknown download order '{order}'.")
 
-    decorated: List[Tuple[Optional[datetime], str, Dict[str, object]]] = []
+    # Undated docs always go last. Dated docs take two stable single-key sorts
+    # (doc ID, then post time), which avoids building and comparing key tuples.
+    dated: List[Tuple[datetime, str, Dict[str, object]]] = []
+    undated: List[Tuple[None, str, Dict[str, object]]] = []
     for doc in docs:
-        decorated.append((doc_post_datetime_for_sort(doc), extract_doc_id(doc), doc))
+        post_datetime = doc_post_datetime_for_sort(doc)
+        if post_datetime is None:
+            undated.append((None, extract_doc_id(doc), doc))
+        else:
+            dated.append((post_datetime, extract_doc_id(doc), doc))
 
-    if order == "newest-first":
-        sorted_rows = sorted(
-            decorated,
-            key=lambda row: (row[0] is not None, row[0] or datetime.min, row[1]),
-            reverse=True,
-        )
-        return [row[2] for row in sorted_rows]
+    newest_first = order == "newest-first"
+    by_doc_id = itemgetter(1)
+    dated.sort(key=by_doc_id, reverse=newest_first)
+    dated.sort(key=itemgetter(0), reverse=newest_first)
+    undated.sort(key=by_doc_id, reverse=newest_first)
+    return [row[2] for row in dated] + [row[2] for row in undated]
 
-    if order == "oldest-first":
-        sorted_rows = sorted(
-            decorated,
-            key=lambda row: (row[0] is None, row[0] or datetime.max, row[1]),
-        )
-        return [row[2] for row in sorted_rows]
 
-    raise ValueError(f"Unknown download order '{order}'.")
+# Fast paths for the common ERCOT date/datetime shapes; anything else (or an
+# out-of-range field) falls back to the strptime chains below.
+_CSV_ISO_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+_CSV_US_DATE_RE = re.compile(r"([0-9]{1,2})/([0-9]{1,2})/([0-9]{4}|[0-9]{2})")
+_CSV_ISO_DATETIME_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})[ T]([0-9]{2}):([0-9]{2})(?::([0-9]{2}))?")
+_CSV_US_DATETIME_RE = re.compile(r"([0-9]{1,2})/([0-9]{1,2})/([0-9]{4}) ([0-9]{1,2}):([0-9]{2})(?::([0-9]{2}))?")
+
+
+def _fast_csv_date(raw: str) -> Optional[datetime]:
+    match = _CSV_ISO_DATE_RE.fullmatch(raw)
+    try:
+        if match is not None:
+            return datetime(int(match[1]), int(match[2]), int(match[3]))
+        match = _CSV_US_DATE_RE.fullmatch(raw)
+        if match is not None:
+            year = int(match[3])
+            if len(match[3]) == 2:
+                # Same pivot as strptime's %y.
+                year += 2000 if year <= 68 else 1900
+            return datetime(year, int(match[1]), int(match[2]))
+    except ValueError:
+        return None
+    return None
+
+
+def _fast_csv_datetime(raw: str) -> Optional[datetime]:
+    match = _CSV_ISO_DATETIME_RE.fullmatch(raw)
+    try:
+        if match is not None:
+            year, month, day = int(match[1]), int(match[2]), int(match[3])
+        else:
+            match = _CSV_US_DATETIME_RE.fullmatch(raw)
+            if match is None:
+                return None
+            month, day, year = int(match[1]), int(match[2]), int(match[3])
+        return datetime(year, month, day, int(match[4]), int(match[5]), int(match[6] or 0))
+    except ValueError:
+        return None
 
 
 @lru_cache(maxsize=CSV_PARSE_CACHE_SIZE)
 def _parse_csv_date_cached(raw: str) -> Optional[datetime]:
+    parsed = _fast_csv_date(raw)
+    if parsed is not None:
+        return parsed
     for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
         try:
             return datetime.strptime(raw, fmt)
@@ -1523,9 +2332,25 @@ def _parse_hour_ending(value: str) -> Optional[Tuple[int, int]]:
 
 
 @lru_cache(maxsize=CSV_PARSE_CACHE_SIZE)
-def _parse_csv_datetime_cached(raw: str) -> Optional[datetime]:
+def _parse_csv_date_hour_cached(day_value: str, hour_value: str) -> Optional[datetime]:
+    # Date/hour pairs repeat across every interval row of a delivery hour, so
+    # memoize the combined datetime rather than rebuilding it per row.
+    day = _parse_csv_date(day_value)
+    hm = _parse_hour_ending(hour_value)
+    if day is None or hm is None:
+        return None
+    return day.replace(hour=hm[0], minute=hm[1])
+
+
+@lru_cache(maxsize=CSV_PARSE_CACHE_SIZE)
+def _parse_csv_datetime(value: str) -> Optional[datetime]:
+    # Keyed on the raw cell so repeated stamps are a single C-level cache hit.
+    raw = value.strip()
     if ":" not in raw:
         return None
+    parsed = _fast_csv_datetime(raw)
+    if parsed is not None:
+        return parsed
     for fmt in (
         "%Y-%m-%d %H:%M:%S",
         "%Y-%m-%d %H:%M",
@@ -1546,140 +2371,182 @@ def _parse_csv_datetime_cached(raw: str) -> Optional[datetime]:
     return parsed
 
 
-def _parse_csv_datetime(value: str) -> Optional[datetime]:
-    raw = value.strip()
-    if not raw:
-        return None
-    return _parse_csv_datetime_cached(raw)
+# Column preference lists for CSV row timestamps; names are lowercased headers.
+_ROW_TIMESTAMP_KEYS = (
+    "scedtimestamp",
+    "scedtimestamputc",
+    "deliveryinterval",
+    "intervalending",
+    "intervalend",
+    "intervaltime",
+    "datetime",
+    "timestamp",
+    "postingtime",
+    "postdatetime",
+    "hourendingdatetime",
+    "deliverydatetime",
+    # Older wind files store full datetime in HOUR_ENDING.
+    "hour_ending",
+)
+_ROW_TIMESTAMP_PAIRS = (
+    ("deliverydate", "hourending"),
+    ("delivery_date", "hour_ending"),
+    ("operday", "hourending"),
+    ("deliverydate", "deliveryhour"),
+)
+_ROW_TARGET_KEYS = (
+    "deliveryinterval",
+    "intervalending",
+    "intervalend",
+    "intervaltime",
+    "hourendingdatetime",
+    "deliverydatetime",
+    "scedtimestamp",
+    "scedtimestamputc",
+    "datetime",
+    "timestamp",
+)
+_ROW_TARGET_PAIRS = (
+    ("deliverydate", "hourending"),
+    ("delivery_date", "hour_ending"),
+    ("deliverydate", "deliveryhour"),
+    ("operday", "hourending"),
+    ("operatingday", "hourending"),
+    ("marketday", "hourending"),
+    ("date", "hourending"),
+)
+_ROW_ISSUE_KEYS = (
+    "postingtime",
+    "postdatetime",
+    "publishdatetime",
+    "issuetime",
+    "issue_datetime",
+    "forecastissuedatetime",
+    "createdatetime",
+    "createdat",
+)
+_ROW_ISSUE_DATE_KEYS = ("postingdate", "publishdate", "issuedate", "issue_date")
+MonthlySortKey = Union[datetime, Tuple[datetime, datetime]]
 
 
-def _csv_row_timestamp(row: Dict[str, str], lower_to_name: Dict[str, str]) -> Optional[datetime]:
-    def get(name: str) -> str:
-        actual = lower_to_name.get(name.lower())
-        if actual is None:
-            return ""
-        return str(row.get(actual, "") or "")
+class RowTimestampResolver:
+    """Per-file row timestamp parser with header lookups resolved up front.
 
-    # Single-column timestamps.
-    for key in (
-        "scedtimestamp",
-        "scedtimestamputc",
-        "deliveryinterval",
-        "intervalending",
-        "intervalend",
-        "intervaltime",
-        "datetime",
-        "timestamp",
-        "postingtime",
-        "postdatetime",
-        "hourendingdatetime",
-        "deliverydatetime",
-    ):
-        parsed = _parse_csv_datetime(get(key))
-        if parsed is not None:
-            return parsed
+    ``lower_to_column`` maps lowercased header names to row indexes; rows are
+    csv.reader lists padded to the header width.
+    """
 
-    # Older wind files store full datetime in HOUR_ENDING.
-    parsed_hour_ending_dt = _parse_csv_datetime(get("hour_ending"))
-    if parsed_hour_ending_dt is not None:
-        return parsed_hour_ending_dt
-
-    # Date and hour column pairs.
-    for date_key, hour_key in (
-        ("deliverydate", "hourending"),
-        ("delivery_date", "hour_ending"),
-        ("operday", "hourending"),
-        ("deliverydate", "deliveryhour"),
-    ):
-        day = _parse_csv_date(get(date_key))
-        hm = _parse_hour_ending(get(hour_key))
-        if day is not None and hm is not None:
-            return day.replace(hour=hm[0], minute=hm[1])
+    def __init__(self, lower_to_column: Dict[str, int]) -> None:
+        self.lower_to_column = lower_to_column
 
-    return None
+        def columns(keys: Sequence[str]) -> Tuple[int, ...]:
+            return tuple(lower_to_column[key] for key in keys if key in lower_to_column)
 
+        def pairs(keys: Sequence[Tuple[str, str]]) -> Tuple[Tuple[int, int], ...]:
+            return tuple(
+                (lower_to_column[date_key], lower_to_column[hour_key])
+                for date_key, hour_key in keys
+                if date_key in lower_to_column and hour_key in lower_to_column
+            )
 
-def _csv_row_target_timestamp(row: Dict[str, str], lower_to_name: Dict[str, str]) -> Optional[datetime]:
-    def get(name: str) -> str:
-        actual = lower_to_name.get(name.lower())
-        if actual is None:
-            return ""
-        return str(row.get(actual, "") or "")
+        self.timestamp_columns = columns(_ROW_TIMESTAMP_KEYS)
+        self.timestamp_pairs = pairs(_ROW_TIMESTAMP_PAIRS)
+        self.target_columns = columns(_ROW_TARGET_KEYS)
+        self.target_pairs = pairs(_ROW_TARGET_PAIRS)
+        self.issue_columns = columns(_ROW_ISSUE_KEYS)
+        self.issue_date_columns = columns(_ROW_ISSUE_DATE_KEYS)
+
+    @staticmethod
+    def _first_datetime(row: Sequence[str], columns: Tuple[int, ...]) -> Optional[datetime]:
+        for column in columns:
+            value = row[column]
+            if value:
+                parsed = _parse_csv_datetime(value)
+                if parsed is not None:
+                    return parsed
+        return None
 
-    for key in (
-        "deliveryinterval",
-        "intervalending",
-        "intervalend",
-        "intervaltime",
-        "hourendingdatetime",
-        "deliverydatetime",
-        "scedtimestamp",
-        "scedtimestamputc",
-        "datetime",
-        "timestamp",
-    ):
-        parsed = _parse_csv_datetime(get(key))
+    @staticmethod
+    def _first_date_hour(row: Sequence[str], pairs: Tuple[Tuple[int, int], ...]) -> Optional[datetime]:
+        for date_column, hour_column in pairs:
+            day_value = row[date_column]
+            hour_value = row[hour_column]
+            if not (day_value and hour_value):
+                continue
+            parsed = _parse_csv_date_hour_cached(day_value, hour_value)
+            if parsed is not None:
+                return parsed
+        return None
+
+    def timestamp(self, row: Sequence[str]) -> Optional[datetime]:
+        parsed = self._first_datetime(row, self.timestamp_columns)
         if parsed is not None:
             return parsed
+        return self._first_date_hour(row, self.timestamp_pairs)
 
-    for date_key, hour_key in (
-        ("deliverydate", "hourending"),
-        ("delivery_date", "hour_ending"),
-        ("deliverydate", "deliveryhour"),
-        ("operday", "hourending"),
-        ("operatingday", "hourending"),
-        ("marketday", "hourending"),
-        ("date", "hourending"),
-    ):
-        day = _parse_csv_date(get(date_key))
-        hm = _parse_hour_ending(get(hour_key))
-        if day is not None and hm is not None:
-            return day.replace(hour=hm[0], minute=hm[1])
-
-    return None
-
-
-def _csv_row_issue_timestamp(row: Dict[str, str], lower_to_name: Dict[str, str]) -> Optional[datetime]:
-    def get(name: str) -> str:
-        actual = lower_to_name.get(name.lower())
-        if actual is None:
-            return ""
-        return str(row.get(actual, "") or "")
+    def target_timestamp(self, row: Sequence[str]) -> Optional[datetime]:
+        parsed = self._first_datetime(row, self.target_columns)
+        if parsed is not None:
+            return parsed
+        return self._first_date_hour(row, self.target_pairs)
 
-    for key in (
-        "postingtime",
-        "postdatetime",
-        "publishdatetime",
-        "issuetime",
-        "issue_datetime",
-        "forecastissuedatetime",
-        "createdatetime",
-        "createdat",
-    ):
-        parsed = _parse_csv_datetime(get(key))
+    def issue_timestamp(self, row: Sequence[str]) -> Optional[datetime]:
+        parsed = self._first_datetime(row, self.issue_columns)
         if parsed is not None:
             return parsed
+        for column in self.issue_date_columns:
+            value = row[column]
+            if value:
+                parsed_date = _parse_csv_date(value)
+                if parsed_date is not None:
+                    return parsed_date
+        return None
 
-    for key in ("postingdate", "publishdate", "issuedate", "issue_date"):
-        parsed_date = _parse_csv_date(get(key))
-        if parsed_date is not None:
-            return parsed_date
+    # Single-column strategies key on the bare datetime: no per-row tuple, and
+    # comparing datetimes directly is about twice as fast as comparing 1-tuples.
+    def _postdatetime_key(self, row: Sequence[str]) -> Optional[MonthlySortKey]:
+        issue_time = self.issue_timestamp(row)
+        if issue_time is not None:
+            return issue_time
+        return self.timestamp(row)
 
-    return None
+    def _forecast_aware_key(self, row: Sequence[str]) -> Optional[MonthlySortKey]:
+        target_time = self.target_timestamp(row)
+        issue_time = self.issue_timestamp(row)
+
+        if target_time is None and issue_time is None:
+            fallback = self.timestamp(row)
+            if fallback is None:
+                return None
+            return (fallback, fallback)
+        if target_time is None:
+            target_time = issue_time
+        if issue_time is None:
+            issue_time = target_time
+        return (target_time, issue_time)
 
+    def key_function(self, sort_strategy: str) -> Callable[[Sequence[str]], Optional[MonthlySortKey]]:
+        """Bind the row key for *sort_strategy* once, instead of dispatching per row.
 
-def resolve_monthly_sort_strategy(sort_strategy: str, lower_to_name: Dict[str, str]) -> str:
-    if sort_strategy == "postdatetime":
-        return "postdatetime"
-    if sort_strategy == "timestamp":
-        return "timestamp"
-    if sort_strategy == "forecast-aware":
-        return "forecast-aware"
-    if sort_strategy != "auto":
+        Keys are a datetime, or a (target, issue) pair for forecast-aware sorts.
+        """
+        if sort_strategy == "postdatetime":
+            return self._postdatetime_key
+        if sort_strategy == "timestamp":
+            return self.timestamp
+        if sort_strategy == "forecast-aware":
+            return self._forecast_aware_key
         raise ValueError(f"Unknown monthly sort strategy '{sort_strategy}'.")
 
-    available = set(lower_to_name)
-    target_hints = {
+
+@lru_cache(maxsize=256)
+def _row_timestamp_resolver(fieldnames: Tuple[str, ...]) -> RowTimestampResolver:
+    # Monthly files of one dataset share a header, so resolvers are shared per schema.
+    return RowTimestampResolver({name.lower(): index for index, name in enumerate(fieldnames)})
+
+
+_SORT_TARGET_HINTS = frozenset(
+    {
         "deliveryinterval",
         "intervalending",
         "intervalend",
@@ -1695,7 +2562,9 @@ def resolve_monthly_sort_strategy(sort_strategy: str, lower_to_name: Dict[str, s
         "hour_ending",
         "deliveryhour",
     }
-    issue_hints = {
+)
+_SORT_ISSUE_HINTS = frozenset(
+    {
         "postingtime",
         "postdatetime",
         "publishdatetime",
@@ -1709,43 +2578,39 @@ def resolve_monthly_sort_strategy(sort_strategy: str, lower_to_name: Dict[str, s
         "issuedate",
         "issue_date",
     }
-    has_target = any(key in available for key in target_hints)
-    has_issue = any(key in available for key in issue_hints)
-    return "forecast-aware" if has_target and has_issue else "timestamp"
+)
 
 
-def _csv_row_sort_key(
-    row: Dict[str, str],
-    lower_to_name: Dict[str, str],
-    sort_strategy: str,
-) -> Optional[Tuple[datetime, ...]]:
+def resolve_monthly_sort_strategy(sort_strategy: str, lower_to_name: Dict[str, Any]) -> str:
     if sort_strategy == "postdatetime":
-        issue_time = _csv_row_issue_timestamp(row, lower_to_name)
-        if issue_time is not None:
-            return (issue_time,)
-        fallback = _csv_row_timestamp(row, lower_to_name)
-        return (fallback,) if fallback is not None else None
-
+        return "postdatetime"
     if sort_strategy == "timestamp":
-        timestamp = _csv_row_timestamp(row, lower_to_name)
-        return (timestamp,) if timestamp is not None else None
-
+        return "timestamp"
     if sort_strategy == "forecast-aware":
-        target_time = _csv_row_target_timestamp(row, lower_to_name)
-        issue_time = _csv_row_issue_timestamp(row, lower_to_name)
+        return "forecast-aware"
+    if sort_strategy != "auto":
+        raise ValueError(f"Unknown monthly sort strategy '{sort_strategy}'.")
+
+    has_target = not _SORT_TARGET_HINTS.isdisjoint(lower_to_name)
+    has_issue = not _SORT_ISSUE_HINTS.isdisjoint(lower_to_name)
+    return "forecast-aware" if has_target and has_issue else "timestamp"
 
-        if target_time is None and issue_time is None:
-            fallback = _csv_row_timestamp(row, lower_to_name)
-            if fallback is None:
-                return None
-            return (fallback, fallback)
-        if target_time is None:
-            target_time = issue_time
-        if issue_time is None:
-            issue_time = target_time
-        return (target_time, issue_time)
 
-    raise ValueError(f"Unknown monthly sort strategy '{sort_strategy}'.")
+@lru_cache(maxsize=256)
+def _monthly_sort_schema(
+    fieldnames: Tuple[str, ...], sort_strategy: str
+) -> Tuple[RowTimestampResolver, str, Callable[[List[str]], Optional[MonthlySortKey]], Optional[List[int]]]:
+    # Everything derived from the header alone, computed once per dataset schema:
+    # resolver, effective strategy, row key function and duplicate-header remap.
+    resolver = _row_timestamp_resolver(fieldnames)
+    effective_strategy = resolve_monthly_sort_strategy(sort_strategy, resolver.lower_to_column)
+    # Duplicate header names keep DictReader/DictWriter semantics, where the
+    # last same-named column feeds every copy.
+    last_index = {name: index for index, name in enumerate(fieldnames)}
+    source_index: Optional[List[int]] = [last_index[name] for name in fieldnames]
+    if source_index == list(range(len(fieldnames))):
+        source_index = None
+    return resolver, effective_strategy, resolver.key_function(effective_strategy), source_index
 
 
 def resolve_monthly_sort_order(sort_option: str, download_order: str) -> Optional[str]:
@@ -1779,11 +2644,14 @@ def _cache_int(value: object) -> Optional[int]:
 
 
 def _read_monthly_sort_cache(path: Path) -> Optional[Dict[str, object]]:
-    cache_path = _monthly_sort_cache_path(path)
-    if not cache_path.exists():
+    # The JSON layout is shared with backfill_post_datetime.py, so keep it; just
+    # read it in one call (no exists() probe) and parse with orjson when present.
+    try:
+        raw = _monthly_sort_cache_path(path).read_bytes()
+    except OSError:
         return None
     try:
-        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:  # noqa: BLE001
         return None
     if not isinstance(payload, dict):
@@ -1808,13 +2676,11 @@ def _write_monthly_sort_cache(
         "classification": classification,
         "size_bytes": size_bytes,
         "mtime_ns": mtime_ns,
-        "updated_at": utc_now_iso(),
     }
+    # No wall-clock field: the payload depends only on the file signature and
+    # sort settings, so repeated runs produce byte-identical caches.
     try:
-        cache_path.write_text(
-            json.dumps(payload, ensure_ascii=True, sort_keys=True),
-            encoding="utf-8",
-        )
+        _write_file_bytes(cache_path, json.dumps(payload, ensure_ascii=True, sort_keys=True).encode("ascii"))
     except Exception:  # noqa: BLE001
         return
 
@@ -1846,6 +2712,193 @@ def _cached_monthly_sort_classification(
     return None
 
 
+def _iter_csv_records(lines: Iterator[str]) -> Iterator[Tuple[List[str], Optional[str]]]:
+    """Yield csv.reader rows plus each row's raw text when it is quote-free.
+
+    *lines* must come from a handle opened with ``newline=""``. Without quotes a
+    line splits on commas exactly as csv.reader would, so only the first line
+    with a quote hands the rest of the stream over to csv.reader.
+    """
+    for line in lines:
+        if '"' in line:
+            for row in csv.reader(chain((line,), lines)):
+                yield row, None
+            return
+        text = line.rstrip("\r\n")
+        yield (text.split(",") if text else []), text
+
+
+def _iter_monthly_csv_rows(
+    records: Iterator[Tuple[List[str], Optional[str]]],
+    width: int,
+    source_index: Optional[List[int]] = None,
+) -> Iterator[Tuple[List[str], Optional[str]]]:
+    """Yield (row, line) with rows shaped as DictReader/DictWriter left them.
+
+    Blank rows are skipped and rows are padded/truncated to the header width.
+    *line* is the exact text csv.writer would emit for the row, when the raw
+    input already is that, otherwise None.
+    """
+    for row, text in records:
+        if not row:
+            continue
+        if len(row) != width:
+            row = row[:width] if len(row) > width else row + [""] * (width - len(row))
+            text = None
+        if source_index is not None:
+            row = [row[index] for index in source_index]
+            text = None
+        yield row, (text + "\r\n" if text is not None else None)
+
+
+def _write_monthly_csv_rows(
+    handle: IO[str], writer: Any, rows: Iterable[Union[str, List[str]]], width: int
+) -> None:
+    # Rows with no delimiter, quote or line break in any cell come out of
+    # csv.writer unquoted, so join those directly and leave the rest to it.
+    # Pre-rendered lines from _iter_monthly_csv_rows pass straight through.
+    write = handle.write
+    separators = width - 1
+    for row in rows:
+        if row.__class__ is str:
+            write(row)
+            continue
+        line = ",".join(row)
+        if not line or line.count(",") != separators or '"' in line or "\n" in line or "\r" in line:
+            writer.writerow(row)
+        else:
+            write(line + "\r\n")
+
+
+# Fixed-width ISO stamps (the postDatetime column consolidation adds) sort
+# chronologically as bytes; the day part is captured so it can be validated.
+_ISO_STAMP_BYTES_RE = re.compile(
+    rb"([0-9]{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12][0-9]|3[01]))([T ])(?:[01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9]"
+)
+
+
+def _csv_column_sorted_by_bytes(path: Path, col_index: int, descending: bool) -> bool:
+    """Return True only if every data row has an ISO stamp in *col_index*, in order.
+
+    Anything this scan cannot vouch for (quotes, bare CR line breaks, short rows,
+    other stamp formats, an out-of-order pair) returns False and leaves the
+    decision to the csv-based scan.
+    """
+    with open(path, "rb") as handle:
+        try:
+            mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return False
+    with mm:
+        if mm.find(b'"') != -1:
+            return False
+        pos = mm.find(b"\n") + 1
+        if pos == 0 or b"\r" in mm[: pos - 1].rstrip(b"\r"):
+            return False
+        size = len(mm)
+        match = _ISO_STAMP_BYTES_RE.fullmatch
+        previous: Optional[bytes] = None
+        separator: Optional[bytes] = None
+        days: Set[bytes] = set()
+        while pos < size:
+            end = mm.find(b"\n", pos)
+            if end < 0:
+                end = size
+            line = mm[pos:end]
+            pos = end + 1
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            if not line:
+                continue
+            if b"\r" in line:
+                return False
+            fields = line.split(b",", col_index + 1)
+            if len(fields) <= col_index:
+                return False
+            value = fields[col_index]
+            stamp = match(value)
+            if stamp is None:
+                return False
+            if separator is None:
+                separator = stamp[2]
+            elif stamp[2] != separator:
+                return False
+            days.add(stamp[1])
+            if previous is not None and (value > previous if descending else value < previous):
+                return False
+            previous = value
+    if previous is None:
+        return False
+    # The regex bounds each field; reject impossible days such as 02-30.
+    try:
+        for day in days:
+            date.fromisoformat(day.decode("ascii"))
+    except ValueError:
+        return False
+    return True
+
+
+def _scan_monthly_csv_sortedness(path: Path, sort_order: str, sort_strategy: str) -> Optional[str]:
+    """Stream sort keys only; return "already"/"skipped", or None if a rewrite is needed."""
+    descending = sort_order == "descending"
+    with open(path, "r", encoding="utf-8", newline="") as handle:
+        records = _iter_csv_records(handle)
+        header = next(records, ([], None))[0]
+        if not header:
+            return "skipped"
+        resolver, effective_strategy, row_sort_key, _ = _monthly_sort_schema(tuple(header), sort_strategy)
+        # Single-column keys whose first choice is present can be checked on raw bytes.
+        key_columns: Tuple[int, ...] = ()
+        if effective_strategy == "postdatetime":
+            key_columns = resolver.issue_columns
+        elif effective_strategy == "timestamp":
+            key_columns = resolver.timestamp_columns
+        if key_columns and _csv_column_sorted_by_bytes(path, key_columns[0], descending):
+            return "already"
+        saw_rows = False
+        saw_unparsed = False
+        previous_key: Optional[MonthlySortKey] = None
+        # Resolver columns are the last of each header name, so duplicate-header
+        # remapping cannot change a sort key and is skipped here.
+        for row, _ in _iter_monthly_csv_rows(records, len(header)):
+            saw_rows = True
+            sort_key = row_sort_key(row)
+            if sort_key is None:
+                saw_unparsed = True
+                continue
+            # Output layout is parsed rows first, then unparsed rows.
+            if saw_unparsed:
+                return None
+            if previous_key is not None and (sort_key > previous_key if descending else sort_key < previous_key):
+                return None
+            previous_key = sort_key
+    if not saw_rows:
+        return "already"
+    return "already" if previous_key is not None else "skipped"
+
+
+def _spill_monthly_sort_run(items: Sequence[Any], directory: Path) -> IO[bytes]:
+    # Pickled in batches next to the source file; the run is deleted on close.
+    handle = tempfile.TemporaryFile(dir=directory)
+    try:
+        for start in range(0, len(items), MONTHLY_SORT_SPILL_BATCH_ROWS):
+            pickle.dump(items[start : start + MONTHLY_SORT_SPILL_BATCH_ROWS], handle, pickle.HIGHEST_PROTOCOL)
+        handle.seek(0)
+    except BaseException:
+        handle.close()
+        raise
+    return handle
+
+
+def _iter_monthly_sort_run(handle: IO[bytes]) -> Iterator[Any]:
+    while True:
+        try:
+            batch = pickle.load(handle)
+        except EOFError:
+            return
+        yield from batch
+
+
 def sort_monthly_csv(path: Path, sort_order: str, sort_strategy: str = "auto") -> str:
     if sort_order not in {"ascending", "descending"}:
         raise ValueError(f"Unknown sort order '{sort_order}'.")
@@ -1865,96 +2918,84 @@ def sort_monthly_csv(path: Path, sort_order: str, sort_strategy: str = "auto") -
     if cached_classification == "skipped":
         return "skipped"
 
-    with open(path, "r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        if not reader.fieldnames:
-            _write_monthly_sort_cache(
-                path,
-                sort_order=sort_order,
-                sort_strategy=sort_strategy,
-                classification="skipped",
-                size_bytes=size_before,
-                mtime_ns=mtime_before,
-            )
-            return "skipped"
-        fieldnames = list(reader.fieldnames)
-        lower_to_name = {name.lower(): name for name in fieldnames}
-        effective_strategy = resolve_monthly_sort_strategy(sort_strategy, lower_to_name)
-        parsed_rows: List[Tuple[Tuple[datetime, ...], Dict[str, str]]] = []
-        unparsed_rows: List[Dict[str, str]] = []
-        saw_rows = False
-        saw_unparsed = False
-        already_sorted = True
-        previous_key: Optional[Tuple[datetime, ...]] = None
-
-        for row in reader:
-            saw_rows = True
-            sort_key = _csv_row_sort_key(row, lower_to_name, effective_strategy)
-            if sort_key is None:
-                saw_unparsed = True
-                unparsed_rows.append(row)
-                continue
-
-            parsed_rows.append((sort_key, row))
-
-            # Output layout is parsed rows first, then unparsed rows.
-            if saw_unparsed:
-                already_sorted = False
-
-            if previous_key is not None:
-                if sort_order == "ascending" and sort_key < previous_key:
-                    already_sorted = False
-                elif sort_order == "descending" and sort_key > previous_key:
-                    already_sorted = False
-            previous_key = sort_key
-
-    if not saw_rows:
-        _write_monthly_sort_cache(
-            path,
-            sort_order=sort_order,
-            sort_strategy=sort_strategy,
-            classification="sorted",
-            size_bytes=size_before,
-            mtime_ns=mtime_before,
-        )
-        return "already"
-    if not parsed_rows:
-        _write_monthly_sort_cache(
-            path,
-            sort_order=sort_order,
-            sort_strategy=sort_strategy,
-            classification="skipped",
-            size_bytes=size_before,
-            mtime_ns=mtime_before,
-        )
-        return "skipped"
-    if already_sorted:
+    # Steady state is an already-sorted file: check that without buffering rows.
+    scan_status = _scan_monthly_csv_sortedness(path, sort_order, sort_strategy)
+    if scan_status is not None:
         _write_monthly_sort_cache(
             path,
             sort_order=sort_order,
             sort_strategy=sort_strategy,
-            classification="sorted",
+            classification="skipped" if scan_status == "skipped" else "sorted",
             size_bytes=size_before,
             mtime_ns=mtime_before,
         )
-        return "already"
-
-    ordered_parsed = sorted(
-        parsed_rows,
-        key=lambda item: item[0],
-        reverse=(sort_order == "descending"),
-    )
+        return scan_status
 
-    ordered_rows = [item[1] for item in ordered_parsed] + unparsed_rows
+    with open(path, "r", encoding="utf-8", newline="") as handle:
+        records = _iter_csv_records(handle)
+        fieldnames = next(records, ([], None))[0]
+        width = len(fieldnames)
+        _, _, row_sort_key, source_index = _monthly_sort_schema(tuple(fieldnames), sort_strategy)
+        descending = sort_order == "descending"
+        parsed_rows: List[Tuple[Any, Union[str, List[str]]]] = []
+        unparsed_rows: List[Union[str, List[str]]] = []
+        # Large months are sorted in bounded runs spilled to disk and merged on write.
+        runs: List[IO[bytes]] = []
+        # Rows without a sort key keep file order; full batches are spilled the same way.
+        unparsed_runs: List[IO[bytes]] = []
+        try:
+            # Rows are kept as their output text where possible: one string per
+            # row is smaller than a list of cells and needs no re-join on write.
+            for row, line in _iter_monthly_csv_rows(records, width, source_index):
+                sort_key = row_sort_key(row)
+                if sort_key is None:
+                    unparsed_rows.append(row if line is None else line)
+                    if len(unparsed_rows) >= MONTHLY_SORT_RUN_ROWS:
+                        unparsed_runs.append(_spill_monthly_sort_run(unparsed_rows, path.parent))
+                        unparsed_rows = []
+                    continue
+                parsed_rows.append((sort_key, row if line is None else line))
+                if len(parsed_rows) >= MONTHLY_SORT_RUN_ROWS:
+                    parsed_rows.sort(key=itemgetter(0), reverse=descending)
+                    runs.append(_spill_monthly_sort_run(parsed_rows, path.parent))
+                    parsed_rows = []
+        except BaseException:
+            for run in chain(runs, unparsed_runs):
+                run.close()
+            raise
 
-    with open(path, "w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(ordered_rows)
     try:
-        size_after, mtime_after = _monthly_sort_file_signature(path)
-    except OSError:
-        size_after, mtime_after = size_before, mtime_before
+        parsed_rows.sort(key=itemgetter(0), reverse=descending)
+        ordered_rows: Iterable[Tuple[Any, Union[str, List[str]]]] = parsed_rows
+        if runs:
+            # heapq.merge breaks ties by run order, which keeps the full sort stable.
+            ordered_rows = heapq.merge(
+                *(_iter_monthly_sort_run(run) for run in runs),
+                parsed_rows,
+                key=itemgetter(0),
+                reverse=descending,
+            )
+        with open(path, "w", encoding="utf-8", newline="", buffering=MONTHLY_SORT_WRITE_BUFFER_BYTES) as handle:
+            writer = csv.writer(handle)
+            writer.writerow(fieldnames)
+            _write_monthly_csv_rows(handle, writer, map(itemgetter(1), ordered_rows), width)
+            _write_monthly_csv_rows(
+                handle,
+                writer,
+                chain.from_iterable(chain(map(_iter_monthly_sort_run, unparsed_runs), (unparsed_rows,))),
+                width,
+            )
+            # Take the post-write signature from the open handle instead of a
+            # second path lookup; closing without further writes keeps mtime.
+            handle.flush()
+            try:
+                stat_after = os.fstat(handle.fileno())
+                size_after, mtime_after = stat_after.st_size, stat_after.st_mtime_ns
+            except OSError:
+                size_after, mtime_after = size_before, mtime_before
+    finally:
+        for run in chain(runs, unparsed_runs):
+            run.close()
     _write_monthly_sort_cache(
         path,
         sort_order=sort_order,
@@ -1966,6 +3007,46 @@ def sort_monthly_csv(path: Path, sort_order: str, sort_strategy: str = "auto") -
     return "sorted"
 
 
+def _sort_monthly_csv_job(path: Path, sort_order: str, sort_strategy: str) -> Tuple[Path, str]:
+    return path, sort_monthly_csv(path, sort_order, sort_strategy)
+
+
+def iter_sort_monthly_csvs(
+    paths: Sequence[Path],
+    sort_order: str,
+    sort_strategy: str = "auto",
+) -> Iterator[Tuple[Path, Optional[str], Optional[Exception]]]:
+    """Sort each path, yielding (path, status, error) as files finish.
+
+    Sorting is CPU-bound, so larger batches fan out to a process pool; small
+    batches stay in-process to avoid worker startup cost.
+    """
+    if len(paths) < MONTHLY_SORT_PARALLEL_MIN_FILES:
+        for path in paths:
+            try:
+                status = sort_monthly_csv(path, sort_order, sort_strategy)
+            except Exception as exc:  # noqa: BLE001
+                yield path, None, exc
+            else:
+                yield path, status, None
+        return
+    max_workers = min(os.cpu_count() or 1, len(paths))
+    # Not fork: with --overlap-monthly-sort this runs on a background thread, and a
+    # forked worker could inherit a stdout/run.log buffer lock held by another thread.
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(start_method)) as executor:
+        futures = {
+            executor.submit(_sort_monthly_csv_job, path, sort_order, sort_strategy): path for path in paths
+        }
+        for future in as_completed(futures):
+            try:
+                path, status = future.result()
+            except Exception as exc:  # noqa: BLE001
+                yield futures[future], None, exc
+            else:
+                yield path, status, None
+
+
 def parse_args() -> argparse.Namespace:
     default_from = DEFAULT_FROM_DATE
 
@@ -2051,12 +3132,42 @@ def parse_args() -> argparse.Namespace:
         default=256,
         help="Bulk download chunk size (natural number 1..2048). Smaller values reduce 429 throttling risk.",
     )
+    parser.add_argument(
+        "--bulk-workers",
+        type=int,
+        default=1,
+        help=(
+            "Bulk chunk requests kept in flight at once (1 keeps bulk downloads sequential). "
+            "Chunks are still written and logged in order."
+        ),
+    )
     parser.add_argument(
         "--disable-bulk-download",
         action="store_true",
         help="Skip bulk archive downloads and fetch files one-by-one via per-doc fallback.",
     )
+    parser.add_argument(
+        "--listing-lookahead-pages",
+        type=int,
+        default=1,
+        help="Archive listing pages fetched ahead in parallel (1 keeps listing sequential).",
+    )
+    parser.add_argument(
+        "--download-workers",
+        type=int,
+        default=1,
+        help=(
+            "Concurrent per-doc downloads when bulk download is disabled or falls back "
+            "(1 keeps downloads sequential). Requests still honor --request-interval-seconds."
+        ),
+    )
     parser.add_argument("--extract-zips", action="store_true", help="Extract each downloaded ZIP archive.")
+    parser.add_argument(
+        "--extract-workers",
+        type=int,
+        default=1,
+        help="Background threads for --extract-zips so extraction overlaps downloads (0 = extract inline).",
+    )
     parser.add_argument(
         "--consolidate-monthly",
         action="store_true",
@@ -2067,6 +3178,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Delete per-doc source files after successful monthly append.",
     )
+    parser.add_argument(
+        "--monthly-flush-bytes",
+        type=int,
+        default=MONTHLY_APPEND_BUFFER_BYTES,
+        help="Buffer up to this much consolidated CSV text in memory before appending it to monthly files.",
+    )
     parser.add_argument("--dry-run", action="store_true", help="Show planned downloads without downloading files.")
     parser.add_argument("--list-api-products", action="store_true", help="List available products and exit.")
     parser.add_argument("--timeout-seconds", type=int, default=60, help="HTTP timeout in seconds.")
@@ -2160,6 +3277,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Also sort already-existing monthly CSV files for each selected dataset.",
     )
+    parser.add_argument(
+        "--overlap-monthly-sort",
+        action="store_true",
+        help="Sort each dataset's monthly CSVs in the background while the next dataset downloads.",
+    )
     parser.add_argument(
         "--download-order",
         choices=("api", "newest-first", "oldest-first"),
@@ -2172,6 +3294,18 @@ def parse_args() -> argparse.Namespace:
         default=0.60,
         help="Minimum delay between API requests to reduce 429 throttling.",
     )
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=None,
+        help="API request rate shared by all download workers (default: 1 / --request-interval-seconds; 0 = unlimited).",
+    )
+    parser.add_argument(
+        "--request-burst",
+        type=int,
+        default=1,
+        help="Requests allowed back-to-back before --requests-per-second pacing applies.",
+    )
     parser.add_argument("--token-url", default=TOKEN_URL, help="Token endpoint URL.")
     parser.add_argument("--client-id", default=DEFAULT_CLIENT_ID, help="OIDC client_id for ERCOT token call.")
     parser.add_argument(
@@ -2184,6 +3318,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Write download metadata manifest JSON into output directory.",
     )
+    parser.add_argument(
+        "--pretty-summary",
+        action="store_true",
+        help="Indent summary.json and the download manifest instead of writing compact JSON.",
+    )
     parser.add_argument(
         "--state-dir",
         default="state",
@@ -2202,6 +3341,18 @@ def parse_args() -> argparse.Namespace:
         action="store_false",
         help="Disable checkpoint resume for this run.",
     )
+    parser.add_argument(
+        "--state-flush-every",
+        type=int,
+        default=DATASET_STATE_SAVE_EVERY,
+        help="Write the resume checkpoint after this many completed docs/pages at most.",
+    )
+    parser.add_argument(
+        "--state-flush-interval-seconds",
+        type=float,
+        default=DATASET_STATE_SAVE_INTERVAL_SECONDS,
+        help="Also write the resume checkpoint once this many seconds have passed since the last write (0 = count only).",
+    )
     parser.add_argument(
         "--logs-dir",
         default="logs/downloads",
@@ -2217,6 +3368,11 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
+def _exit_on_sigterm(signum: int, frame: Any) -> None:
+    # Turn SIGTERM into SystemExit so main's cleanup flushes buffered checkpoints and markers.
+    raise SystemExit(f"Terminated by signal {signum}.")
+
+
 def main() -> None:
     args = parse_args()
     run_started_at = utc_now_iso()
@@ -2229,24 +3385,41 @@ def main() -> None:
 
     original_stdout = sys.stdout
     original_stderr = sys.stderr
-    run_log_handle = open(run_log_path, "a", encoding="utf-8")
-    failures_handle = open(failures_csv_path, "w", encoding="utf-8", newline="")
+    # Unwound at the very end of main: signal handler and std streams first, then the log files.
+    teardown = ExitStack()
+    run_log_handle = teardown.enter_context(
+        open(run_log_path, "a", encoding="utf-8", buffering=RUN_LOG_BUFFER_BYTES)
+    )
+    failures_handle = teardown.enter_context(open(failures_csv_path, "w", encoding="utf-8", newline=""))
     failure_writer = csv.DictWriter(
         failures_handle,
         fieldnames=("timestamp", "dataset_id", "stage", "doc_id", "page", "error"),
     )
     failure_writer.writeheader()
     failures_handle.flush()
+    pending_failure_rows = 0
     sys.stdout = TeeStream(original_stdout, run_log_handle)
     sys.stderr = TeeStream(original_stderr, run_log_handle)
+    teardown.callback(setattr, sys, "stderr", original_stderr)
+    teardown.callback(setattr, sys, "stdout", original_stdout)
+    if threading.current_thread() is threading.main_thread():
+        teardown.callback(signal.signal, signal.SIGTERM, signal.signal(signal.SIGTERM, _exit_on_sigterm))
 
     stats = DownloadStats()
-    manifest_rows: List[Dict[str, object]] = []
+    manifest_writer: Optional[ManifestWriter] = None
     dataset_summaries: Dict[str, Dict[str, Any]] = {}
     selected_ids: List[str] = []
     monthly_sort_order: Optional[str] = None
     summary_status = "completed"
     fatal_error: Optional[str] = None
+    active_state_writer: Optional[DatasetStateWriter] = None
+    # Monthly rows are written before the markers that claim them, and markers before
+    # every state save, so resume never skips past unwritten rows or IDs.
+    monthly_writer = MonthlyCsvWriter(args.monthly_flush_bytes)
+    marker_writer = MarkerWriter(before_flush=monthly_writer.flush)
+
+    # --overlap-monthly-sort records sort failures from its worker thread.
+    failures_lock = threading.Lock()
 
     def record_failure(
         *,
@@ -2256,17 +3429,60 @@ def main() -> None:
         doc_id: str = "",
         page: int = 0,
     ) -> None:
-        failure_writer.writerow(
-            {
-                "timestamp": datetime.now().astimezone().isoformat(timespec="seconds"),
-                "dataset_id": dataset_id,
-                "stage": stage,
-                "doc_id": doc_id,
-                "page": page,
-                "error": error,
-            }
-        )
-        failures_handle.flush()
+        nonlocal pending_failure_rows
+        with failures_lock:
+            failure_writer.writerow(
+                {
+                    "timestamp": local_now_iso(),
+                    "dataset_id": dataset_id,
+                    "stage": stage,
+                    "doc_id": doc_id,
+                    "page": page,
+                    "error": error,
+                }
+            )
+            # Failure storms should not pay a flush per row; rows are flushed in
+            # batches, at the end of each dataset and on close.
+            pending_failure_rows += 1
+            if pending_failure_rows >= FAILURES_FLUSH_EVERY:
+                failures_handle.flush()
+                pending_failure_rows = 0
+
+    def sort_dataset_monthly_csvs(dataset_id: str, paths: List[Path], sort_order: str) -> None:
+        for monthly_path, sort_status, exc in iter_sort_monthly_csvs(paths, sort_order, args.monthly_sort_strategy):
+            if exc is not None:
+                stats.monthly_sort_failures += 1
+                record_failure(
+                    dataset_id=dataset_id,
+                    stage="monthly-sort",
+                    error=str(exc),
+                )
+                log_event("MONTHLY_SORT_ERROR", dataset=dataset_id, file=monthly_path, error=str(exc))
+                continue
+            if sort_status == "sorted":
+                stats.monthly_sorted += 1
+            elif sort_status == "already":
+                stats.monthly_already_sorted += 1
+            else:
+                stats.monthly_sort_skipped += 1
+            log_event(
+                "MONTHLY_SORT_DONE",
+                dataset=dataset_id,
+                status=sort_status,
+                file=monthly_path,
+                order=sort_order,
+                strategy=args.monthly_sort_strategy,
+            )
+
+    # One dataset's sort overlaps the next dataset's downloads; datasets never share files.
+    sort_executor = ThreadPoolExecutor(max_workers=1) if args.overlap_monthly_sort else None
+    sort_futures: List[Any] = []
+    earliest_executor: Optional[ThreadPoolExecutor] = None
+    # Set in teardown so a background probe stops instead of finishing for nothing.
+    earliest_stop = threading.Event()
+    # State checkpoints are written off the download loop, one at a time and in order.
+    state_executor = ThreadPoolExecutor(max_workers=1)
+    teardown.callback(state_executor.shutdown)
 
     try:
         log_event("RUN_PATHS", run_dir=run_dir, run_log=run_log_path, failure_log=failures_csv_path)
@@ -2298,6 +3514,24 @@ def main() -> None:
             raise SystemExit("--bulk-chunk-size must be between 1 and 2048.")
         if args.bulk_progress_every < 0:
             raise SystemExit("--bulk-progress-every must be 0 or a positive integer.")
+        if args.bulk_workers < 1:
+            raise SystemExit("--bulk-workers must be a positive integer.")
+        if args.download_workers < 1:
+            raise SystemExit("--download-workers must be a positive integer.")
+        if args.extract_workers < 0:
+            raise SystemExit("--extract-workers must be 0 or a positive integer.")
+        if args.listing_lookahead_pages < 1:
+            raise SystemExit("--listing-lookahead-pages must be a positive integer.")
+        if args.monthly_flush_bytes < 1:
+            raise SystemExit("--monthly-flush-bytes must be a positive integer.")
+        if args.state_flush_every < 1:
+            raise SystemExit("--state-flush-every must be a positive integer.")
+        if args.state_flush_interval_seconds < 0:
+            raise SystemExit("--state-flush-interval-seconds must be 0 or greater.")
+        if args.requests_per_second is not None and args.requests_per_second < 0:
+            raise SystemExit("--requests-per-second must be 0 or greater.")
+        if args.request_burst < 1:
+            raise SystemExit("--request-burst must be a positive integer.")
         if args.delete_source_after_consolidation and not args.consolidate_monthly:
             raise SystemExit("--delete-source-after-consolidation requires --consolidate-monthly.")
         monthly_sort_order = resolve_monthly_sort_order(args.sort_monthly_output, args.download_order)
@@ -2315,6 +3549,16 @@ def main() -> None:
             "tri-month": {1, 10, 20},
             "quad-month": {1, 7, 15, 22},
         }
+        # Resolved once; the per-doc timing block only branches on these.
+        file_timing = args.file_timing_frequency
+        stampdate_threshold = stampdate_thresholds.get(file_timing)
+        schedule_days = calendar_day_schedules.get(file_timing)
+        # Flags the per-doc loop checks on every document.
+        consolidate_monthly = args.consolidate_monthly
+        dry_run = args.dry_run
+        extract_zips = args.extract_zips
+        delete_source_after_consolidation = args.delete_source_after_consolidation
+        resume_state = args.resume_state
 
         selected_profiles = args.profile
         explicit_cli_datasets = normalize_dataset_ids(getattr(args, "cli_dataset", []))
@@ -2360,6 +3604,12 @@ def main() -> None:
             max_retries=args.max_retries,
             retry_sleep_seconds=args.retry_sleep_seconds,
             request_interval_seconds=args.request_interval_seconds,
+            # A dataset's listing, bulk and per-doc pools run one after another, so the largest
+            # sets the size; the background earliest-date probe can hold one more connection.
+            pool_size=max(HTTP_POOL_SIZE, args.listing_lookahead_pages, args.download_workers, args.bulk_workers)
+            + (1 if args.auto_detect_earliest_per_dataset else 0),
+            requests_per_second=args.requests_per_second,
+            request_burst=args.request_burst,
             reauth_config={
                 "username": username,
                 "password": password,
@@ -2391,11 +3641,34 @@ def main() -> None:
 
         outdir = Path(args.outdir)
         outdir.mkdir(parents=True, exist_ok=True)
+        if args.write_manifest:
+            manifest_writer = ManifestWriter(outdir / "download_manifest.json", pretty=args.pretty_summary)
 
         marker_cache: Dict[Path, Set[str]] = {}
         consecutive_network_failures = 0
 
-        for dataset_id in tqdm(selected_ids, desc="Datasets", unit="dataset"):
+        def detect_earliest_date(dataset_id: str) -> Optional[date]:
+            return find_earliest_available_date(
+                client=client,
+                archive_url=dataset_archive_url(dataset_id, product_by_id.get(dataset_id) or {}),
+                dataset_id=dataset_id,
+                search_from=args.from_date,
+                search_to=args.to_date,
+                archive_listing_retries=args.archive_listing_retries,
+                retry_sleep_seconds=args.retry_sleep_seconds,
+                stop_event=earliest_stop,
+            )
+
+        # The earliest-date probe is a serial chain of listing requests, so the next
+        # dataset's probe runs while the current dataset downloads.
+        earliest_futures: Dict[str, Future[Optional[date]]] = {}
+        next_probe_ids: Dict[str, str] = {}
+        if args.auto_detect_earliest_per_dataset:
+            earliest_executor = ThreadPoolExecutor(max_workers=1)
+            probe_ids = [dataset_id for dataset_id in selected_ids if not product_by_id or dataset_id in product_by_id]
+            next_probe_ids = dict(zip(probe_ids, probe_ids[1:]))
+
+        for dataset_id in progress_bar(selected_ids, desc="Datasets", unit="dataset"):
             product = product_by_id.get(dataset_id)
             if product_by_id and product is None:
                 log_event(
@@ -2408,11 +3681,13 @@ def main() -> None:
                 dataset_summaries[dataset_id] = {"status": "skipped_unavailable"}
                 continue
             product = product or {}
-            product_title = str(
-                product.get("reportName") or product.get("name") or DATASETS.get(dataset_id, {}).get("title", "")
-            ).strip()
-            archive_url = maybe_product_archive_href(product) or f"{API_BASE_URL}/archive/{dataset_id.lower()}"
+            catalog_title = DATASETS.get(dataset_id, {}).get("title")
+            product_title = str(product.get("reportName") or product.get("name") or catalog_title or "").strip()
+            archive_url = dataset_archive_url(dataset_id, product)
             log_event("DATASET_START", dataset=dataset_id, title=product_title, archive=archive_url)
+            next_probe_id = next_probe_ids.get(dataset_id)
+            if earliest_executor is not None and next_probe_id is not None:
+                earliest_futures[next_probe_id] = earliest_executor.submit(detect_earliest_date, next_probe_id)
 
             dataset_summary: Dict[str, Any] = {
                 "title": product_title,
@@ -2446,16 +3721,9 @@ def main() -> None:
             printed_calendar_dates: Set[str] = set()
             dataset_from_date = args.from_date
             if args.auto_detect_earliest_per_dataset:
+                probe = earliest_futures.pop(dataset_id, None)
                 try:
-                    detected_from_date = find_earliest_available_date(
-                        client=client,
-                        archive_url=archive_url,
-                        dataset_id=dataset_id,
-                        search_from=args.from_date,
-                        search_to=args.to_date,
-                        archive_listing_retries=args.archive_listing_retries,
-                        retry_sleep_seconds=args.retry_sleep_seconds,
-                    )
+                    detected_from_date = probe.result() if probe is not None else detect_earliest_date(dataset_id)
                 except Exception as exc:  # noqa: BLE001
                     stats.failures += 1
                     dataset_summary["status"] = "earliest_detection_failed"
@@ -2490,6 +3758,25 @@ def main() -> None:
                 max_docs_per_dataset=args.max_docs_per_dataset,
                 archive_url=archive_url,
             )
+            marker_writer.flush()
+            if active_state_writer is not None:
+                active_state_writer.flush()
+            archive_cache_writer = ArchiveDocsCacheWriter(dataset_cache_path)
+
+            def flush_dataset_buffers() -> None:
+                # Runs before each state save so the checkpoint never points past buffered pages or markers.
+                marker_writer.flush()
+                archive_cache_writer.flush()
+
+            state_writer = DatasetStateWriter(
+                dataset_state_path,
+                dataset_state,
+                every=args.state_flush_every,
+                interval_seconds=args.state_flush_interval_seconds,
+                before_save=flush_dataset_buffers,
+                executor=state_executor,
+            )
+            active_state_writer = state_writer
             cached_docs: List[Dict[str, Any]] = []
             resume_start_page = 1
             if args.resume_state:
@@ -2523,7 +3810,7 @@ def main() -> None:
                     if dataset_cache_path.exists():
                         dataset_cache_path.unlink()
                 dataset_state["status"] = "running"
-                save_dataset_state(dataset_state_path, dataset_state)
+                state_writer.save()
 
             dataset_post_datetime_from = to_start_iso(dataset_from_date)
             dataset_post_datetime_to = to_end_iso(args.to_date)
@@ -2543,12 +3830,12 @@ def main() -> None:
                 def on_page_listed(page: int, page_docs: List[Dict[str, Any]], total_docs: int) -> None:
                     if not args.resume_state:
                         return
-                    append_archive_docs_cache(dataset_cache_path, page, page_docs)
+                    archive_cache_writer.add(page, page_docs)
                     dataset_state["last_listed_page"] = page
                     dataset_state["total_listed_docs"] = total_docs
                     dataset_state["listing_complete"] = False
                     dataset_state["status"] = "running"
-                    save_dataset_state(dataset_state_path, dataset_state)
+                    state_writer.checkpoint()
 
                 try:
                     docs = list_archive_docs_with_retries(
@@ -2564,6 +3851,7 @@ def main() -> None:
                         start_page=resume_start_page,
                         seed_docs=cached_docs,
                         on_page_listed=on_page_listed if args.resume_state else None,
+                        lookahead_pages=args.listing_lookahead_pages,
                     )
                 except Exception as exc:  # noqa: BLE001
                     stats.failures += 1
@@ -2577,14 +3865,14 @@ def main() -> None:
                     if args.resume_state:
                         dataset_state["status"] = "failed"
                         dataset_state["failure"] = str(exc)
-                        save_dataset_state(dataset_state_path, dataset_state)
+                        state_writer.save()
                     log_event("ARCHIVE_LISTING_ERROR", dataset=dataset_id, error=str(exc))
                     continue
                 if args.resume_state:
                     dataset_state["listing_complete"] = True
                     dataset_state["total_listed_docs"] = len(docs)
                     dataset_state["status"] = "running"
-                    save_dataset_state(dataset_state_path, dataset_state)
+                    state_writer.save()
 
             dataset_summary["docs_listed"] = len(docs)
             log_event(
@@ -2598,7 +3886,7 @@ def main() -> None:
                 dataset_summary["status"] = "no_docs_in_window"
                 if args.resume_state:
                     dataset_state["status"] = "completed"
-                    save_dataset_state(dataset_state_path, dataset_state)
+                    state_writer.save()
                 log_event("DATASET_EMPTY", dataset=dataset_id, reason="no_docs_in_window")
                 continue
             if args.download_order != "api":
@@ -2633,24 +3921,84 @@ def main() -> None:
                 bulk_chunk_size=args.bulk_chunk_size,
             )
 
+            # Bulk chunks, prefetch and the per-doc loop all read these instead of
+            # re-deriving IDs, filenames and paths for every doc.
+            for doc in docs[resume_doc_index:]:
+                doc["__target"] = doc_target(outdir, dataset_id, doc)
+            if not args.dry_run:
+                # Only the month folders this pass writes to, not the dataset's whole history.
+                pass_targets = (doc["__target"] for doc in docs[resume_doc_index:])
+                removed_partials = remove_partial_downloads(
+                    {target.destination.parent for target in pass_targets if target is not None}
+                )
+                if removed_partials:
+                    log_event("PARTIAL_FILES_REMOVED", dataset=dataset_id, files=removed_partials)
+            # One scandir per output folder answers the exists/size checks; every write
+            # or delete below updates the entry so later checks stay accurate.
+            folder_file_sizes: Dict[Path, Dict[str, int]] = {}
+
+            def file_size_on_disk(target: DocTarget) -> int:
+                folder = target.destination.parent
+                sizes = folder_file_sizes.get(folder)
+                if sizes is None:
+                    sizes = folder_file_sizes[folder] = scan_file_sizes(folder)
+                return sizes.get(target.filename, -1)
+
+            def refresh_file_size(target: DocTarget, size: Optional[int] = None) -> None:
+                sizes = folder_file_sizes.get(target.destination.parent)
+                if sizes is None:
+                    return
+                if size is None:
+                    try:
+                        size = target.destination.stat().st_size
+                    except OSError:
+                        sizes.pop(target.filename, None)
+                        return
+                sizes[target.filename] = size
+
+            def forget_file(target: DocTarget) -> None:
+                sizes = folder_file_sizes.get(target.destination.parent)
+                if sizes is not None:
+                    sizes.pop(target.filename, None)
+
             def save_doc_checkpoint(doc_index: int, doc_id: str, doc: Dict[str, Any]) -> None:
                 if not args.resume_state:
                     return
+                target = doc["__target"]
                 dataset_state["next_doc_index"] = doc_index + 1
                 dataset_state["last_completed_doc_id"] = doc_id or None
-                dataset_state["last_completed_stampdate"] = str(doc.get("postDatetime") or "") or None
-                dataset_state["last_completed_page"] = _safe_int(doc.get("__archive_page"), 0)
+                if target is not None:
+                    dataset_state["last_completed_stampdate"] = target.post_datetime or None
+                    dataset_state["last_completed_page"] = target.archive_page
+                else:
+                    dataset_state["last_completed_stampdate"] = str(doc.get("postDatetime") or "") or None
+                    dataset_state["last_completed_page"] = _safe_int(doc.get("__archive_page"), 0)
                 dataset_state["status"] = "running"
-                save_dataset_state(dataset_state_path, dataset_state)
+                state_writer.checkpoint()
+
+            def consolidated_doc_ids(marker_path: Path) -> Set[str]:
+                known_doc_ids = marker_cache.get(marker_path)
+                if known_doc_ids is None:
+                    known_doc_ids = load_marker_doc_ids(marker_path)
+                    marker_cache[marker_path] = known_doc_ids
+                return known_doc_ids
+
+            def pending_download_destination(target: DocTarget) -> Optional[Path]:
+                # Destination for a doc that still needs fetching; None when consolidated or already on disk.
+                if args.consolidate_monthly:
+                    if target.doc_id in consolidated_doc_ids(target.marker_path):
+                        # Already consolidated; do not redownload a source file that would be skipped later.
+                        return None
+                size_on_disk = file_size_on_disk(target)
+                exists_and_matches = size_on_disk >= 0 and (target.wanted_size < 0 or size_on_disk == target.wanted_size)
+                return None if exists_and_matches else target.destination
 
             chunk_size = args.bulk_chunk_size
+            # Docs fetched ahead of the per-doc loop (bulk or concurrent prefetch).
             bulk_written_doc_ids: Set[str] = set()
-            doc_chunks: List[List[Dict[str, Any]]]
-            if args.disable_bulk_download:
-                doc_chunks = []
-            else:
-                doc_chunks = [docs[i : i + chunk_size] for i in range(resume_doc_index, len(docs), chunk_size)]
-            total_chunks = len(doc_chunks)
+            # Chunk start offsets; each chunk's slice is taken only when it is needed.
+            chunk_starts = range(0) if args.disable_bulk_download else range(resume_doc_index, len(docs), chunk_size)
+            total_chunks = len(chunk_starts)
             bulk_disabled_after_error = False
 
             def should_log_bulk_progress(chunk_id: int) -> bool:
@@ -2664,472 +4012,607 @@ def main() -> None:
 
             if args.disable_bulk_download:
                 log_event("BULK_DISABLED", dataset=dataset_id, reason="flag_disable_bulk_download")
-            elif doc_chunks:
-                log_event("BULK_QUEUE", dataset=dataset_id, chunks=len(doc_chunks), chunk_size=chunk_size)
-            for chunk_id, doc_chunk in tqdm(enumerate(doc_chunks, start=1), total=total_chunks, desc=f"Bulk {dataset_id}", unit="chunk", leave=False):
-                chunk_started_at = time.monotonic()
-                chunk_label = f"{chunk_id}/{len(doc_chunks)}"
-                chunk_doc_ids: List[str] = []
+            elif total_chunks:
+                log_event("BULK_QUEUE", dataset=dataset_id, chunks=total_chunks, chunk_size=chunk_size)
+
+            def bulk_chunk_candidates(doc_chunk: List[Dict[str, Any]]) -> BulkChunkCandidates:
+                # One pass picks the doc IDs to request and groups docs by ID for the write loop.
                 missing_doc_id_count = 0
+                docs_by_id: Dict[str, List[Dict[str, Any]]] = {}
+                targets: List[DocTarget] = []
                 for doc in doc_chunk:
-                    doc_id = extract_doc_id(doc)
-                    if not doc_id:
+                    target = doc["__target"]
+                    if target is None:
                         missing_doc_id_count += 1
                         continue
-                    filename = choose_filename(doc)
-                    filename = with_doc_id_suffix(filename, doc_id)
-                    dataset_subdir = dataset_subdir_from_doc(doc)
-                    if args.consolidate_monthly:
-                        monthly_path = monthly_csv_path(outdir, dataset_id, dataset_subdir)
-                        marker_path = marker_path_for_monthly(monthly_path)
-                        known_doc_ids = marker_cache.get(marker_path)
-                        if known_doc_ids is None:
-                            known_doc_ids = load_marker_doc_ids(marker_path)
-                            marker_cache[marker_path] = known_doc_ids
-                        if doc_id in known_doc_ids:
-                            # Already consolidated; do not bulk-redownload a source file that would be skipped later.
-                            continue
-                    destination = outdir / dataset_id / dataset_subdir / filename
-                    wanted_size = expected_size(doc)
-                    exists_and_matches = (
-                        destination.exists()
-                        and (wanted_size < 0 or destination.stat().st_size == wanted_size)
-                    )
-                    if not exists_and_matches:
-                        chunk_doc_ids.append(doc_id)
+                    docs_by_id.setdefault(target.doc_id, []).append(doc)
+                    targets.append(target)
+                done_markers: Set[Path] = set()
+                if args.consolidate_monthly:
+                    # Months whose marker already lists every doc in the chunk need no per-doc checks.
+                    ids_by_marker: Dict[Path, Set[str]] = {}
+                    for target in targets:
+                        ids_by_marker.setdefault(target.marker_path, set()).add(target.doc_id)
+                    done_markers = {
+                        marker_path
+                        for marker_path, doc_ids in ids_by_marker.items()
+                        if doc_ids <= consolidated_doc_ids(marker_path)
+                    }
+                chunk_doc_ids = [
+                    target.doc_id
+                    for target in targets
+                    if target.marker_path not in done_markers and pending_download_destination(target) is not None
+                ]
+                return chunk_doc_ids, missing_doc_id_count, docs_by_id
+
+            # Up to --bulk-workers chunk requests run ahead on a pool, but chunks are
+            # consumed strictly in order, so writes, stats and logs stay on this thread.
+            bulk_pool = (
+                ThreadPoolExecutor(max_workers=args.bulk_workers) if args.bulk_workers > 1 and total_chunks > 1 else None
+            )
+            bulk_in_flight: Dict[int, Any] = {}
+            bulk_candidates: Dict[int, BulkChunkCandidates] = {}
+            next_chunk_to_submit = 1
+            try:
+                for chunk_id, chunk_start in progress_bar(enumerate(chunk_starts, start=1), total=total_chunks, desc=f"Bulk {dataset_id}", unit="chunk", leave=False):
+                    chunk_started_at = time.monotonic()
+                    chunk_label = f"{chunk_id}/{total_chunks}"
+                    doc_chunk = docs[chunk_start : chunk_start + chunk_size]
+                    if bulk_pool is not None:
+                        while next_chunk_to_submit <= min(chunk_id + args.bulk_workers - 1, total_chunks):
+                            next_start = chunk_starts[next_chunk_to_submit - 1]
+                            candidates = bulk_chunk_candidates(docs[next_start : next_start + chunk_size])
+                            bulk_candidates[next_chunk_to_submit] = candidates
+                            if candidates[0]:
+                                bulk_in_flight[next_chunk_to_submit] = bulk_pool.submit(
+                                    client.iter_download_docs, dataset_id, candidates[0], strict_count=False
+                                )
+                            next_chunk_to_submit += 1
+                        chunk_doc_ids, missing_doc_id_count, docs_by_id = bulk_candidates.pop(chunk_id)
+                    else:
+                        chunk_doc_ids, missing_doc_id_count, docs_by_id = bulk_chunk_candidates(doc_chunk)
 
-                if missing_doc_id_count > 0:
-                    log_event(
-                        "BULK_WARN",
-                        dataset=dataset_id,
-                        chunk=chunk_label,
-                        missing_doc_id=missing_doc_id_count,
-                    )
-                if not chunk_doc_ids:
-                    reason = "all_files_exist" if missing_doc_id_count == 0 else "no_bulk_candidates"
-                    if should_log_bulk_progress(chunk_id):
+                    if missing_doc_id_count > 0:
                         log_event(
-                            "BULK_SKIP",
+                            "BULK_WARN",
                             dataset=dataset_id,
                             chunk=chunk_label,
-                            reason=reason,
+                            missing_doc_id=missing_doc_id_count,
+                        )
+                    if not chunk_doc_ids:
+                        reason = "all_files_exist" if missing_doc_id_count == 0 else "no_bulk_candidates"
+                        if should_log_bulk_progress(chunk_id):
+                            log_event(
+                                "BULK_SKIP",
+                                dataset=dataset_id,
+                                chunk=chunk_label,
+                                reason=reason,
+                            )
+                        chunk_elapsed_seconds = time.monotonic() - chunk_started_at
+                        log_event(
+                            "BULK_DONE",
+                            dataset=dataset_id,
+                            chunk=chunk_label,
+                            requested=0,
+                            wrote=0,
+                            status="skipped",
+                            elapsed_seconds=f"{chunk_elapsed_seconds:.2f}",
                         )
-                    chunk_elapsed_seconds = time.monotonic() - chunk_started_at
-                    log_event(
-                        "BULK_DONE",
-                        dataset=dataset_id,
-                        chunk=chunk_label,
-                        requested=0,
-                        wrote=0,
-                        status="skipped",
-                        elapsed_seconds=f"{chunk_elapsed_seconds:.2f}",
-                    )
-                    continue
-
-                if should_log_bulk_progress(chunk_id):
-                    log_event(
-                        "BULK_REQUEST",
-                        dataset=dataset_id,
-                        chunk=chunk_label,
-                        docs=len(chunk_doc_ids),
-                    )
-                try:
-                    doc_contents = client.download_docs(dataset_id, chunk_doc_ids)
-                except Exception as exc:  # noqa: BLE001
-                    error_text = format_exception_message(exc)
-                    stats.failures += 1
-                    dataset_summary["status"] = "running_with_failures"
-                    record_failure(
-                        dataset_id=dataset_id,
-                        stage="bulk-download",
-                        error=error_text,
-                        page=_safe_int(doc_chunk[0].get("__archive_page"), 0),
-                    )
-                    log_event(
-                        "BULK_ERROR",
-                        dataset=dataset_id,
-                        chunk=chunk_label,
-                        docs=len(chunk_doc_ids),
-                        error=error_text,
-                    )
-                    chunk_elapsed_seconds = time.monotonic() - chunk_started_at
-                    log_event(
-                        "BULK_DONE",
-                        dataset=dataset_id,
-                        chunk=chunk_label,
-                        requested=len(chunk_doc_ids),
-                        wrote=0,
-                        status="error",
-                        elapsed_seconds=f"{chunk_elapsed_seconds:.2f}",
-                    )
-                    bulk_disabled_after_error = True
-                    log_event(
-                        "BULK_DISABLED",
-                        dataset=dataset_id,
-                        reason="error_fallback_to_per_doc",
-                        chunk=chunk_label,
-                    )
-                    break
-
-                missing_payload_ids = [doc_id for doc_id in chunk_doc_ids if doc_id not in doc_contents]
-                if missing_payload_ids:
-                    log_event(
-                        "BULK_WARN",
-                        dataset=dataset_id,
-                        chunk=chunk_label,
-                        missing_payload=len(missing_payload_ids),
-                    )
-
-                written_count = 0
-                for doc in doc_chunk:
-                    doc_id = extract_doc_id(doc)
-                    if not doc_id:
-                        continue
-                    content = doc_contents.get(doc_id)
-                    if content is None:
                         continue
-                    filename = choose_filename(doc)
-                    filename = with_doc_id_suffix(filename, doc_id)
-                    dataset_subdir = dataset_subdir_from_doc(doc)
-                    destination = outdir / dataset_id / dataset_subdir / filename
+
+                    if should_log_bulk_progress(chunk_id):
+                        log_event(
+                            "BULK_REQUEST",
+                            dataset=dataset_id,
+                            chunk=chunk_label,
+                            docs=len(chunk_doc_ids),
+                        )
+                    requested_doc_ids = set(chunk_doc_ids)
+                    received_doc_ids: Set[str] = set()
+                    written_count = 0
                     try:
-                        destination.parent.mkdir(parents=True, exist_ok=True)
-                        with open(destination, "wb") as handle:
-                            handle.write(content)
+                        # Payloads are written as the response is unpacked, so only one
+                        # doc's bytes are held in memory at a time.
+                        if chunk_id in bulk_in_flight:
+                            doc_payloads = bulk_in_flight.pop(chunk_id).result()
+                        else:
+                            doc_payloads = client.iter_download_docs(dataset_id, chunk_doc_ids, strict_count=False)
+                        for doc_id, content in doc_payloads:
+                            if doc_id not in requested_doc_ids:
+                                continue
+                            received_doc_ids.add(doc_id)
+                            for doc in docs_by_id[doc_id]:
+                                target = doc["__target"]
+                                destination = target.destination
+                                # Write-then-rename: an interrupted write leaves only a .part file.
+                                tmp_path = destination.with_suffix(destination.suffix + ".part")
+                                try:
+                                    destination.parent.mkdir(parents=True, exist_ok=True)
+                                    _write_file_bytes(tmp_path, content)
+                                    tmp_path.replace(destination)
+                                    refresh_file_size(target, len(content))
+                                except Exception as exc:  # noqa: BLE001
+                                    tmp_path.unlink(missing_ok=True)
+                                    refresh_file_size(target)
+                                    stats.failures += 1
+                                    dataset_summary["status"] = "running_with_failures"
+                                    record_failure(
+                                        dataset_id=dataset_id,
+                                        stage="bulk-write",
+                                        error=str(exc),
+                                        doc_id=doc_id,
+                                        page=_safe_int(doc.get("__archive_page"), 0),
+                                    )
+                                    log_event(
+                                        "BULK_ERROR",
+                                        dataset=dataset_id,
+                                        chunk=chunk_label,
+                                        doc_id=doc_id,
+                                        error=str(exc),
+                                    )
+                                    continue
+                                bulk_written_doc_ids.add(doc_id)
+                                written_count += 1
                     except Exception as exc:  # noqa: BLE001
+                        error_text = format_exception_message(exc)
                         stats.failures += 1
                         dataset_summary["status"] = "running_with_failures"
                         record_failure(
                             dataset_id=dataset_id,
-                            stage="bulk-write",
-                            error=str(exc),
-                            doc_id=doc_id,
-                            page=_safe_int(doc.get("__archive_page"), 0),
+                            stage="bulk-download",
+                            error=error_text,
+                            page=_safe_int(doc_chunk[0].get("__archive_page"), 0),
                         )
                         log_event(
                             "BULK_ERROR",
                             dataset=dataset_id,
                             chunk=chunk_label,
-                            doc_id=doc_id,
-                            error=str(exc),
+                            docs=len(chunk_doc_ids),
+                            error=error_text,
                         )
-                        continue
-                    bulk_written_doc_ids.add(doc_id)
-                    written_count += 1
+                        chunk_elapsed_seconds = time.monotonic() - chunk_started_at
+                        log_event(
+                            "BULK_DONE",
+                            dataset=dataset_id,
+                            chunk=chunk_label,
+                            requested=len(chunk_doc_ids),
+                            wrote=written_count,
+                            status="error",
+                            elapsed_seconds=f"{chunk_elapsed_seconds:.2f}",
+                        )
+                        bulk_disabled_after_error = True
+                        log_event(
+                            "BULK_DISABLED",
+                            dataset=dataset_id,
+                            reason="error_fallback_to_per_doc",
+                            chunk=chunk_label,
+                        )
+                        break
 
-                chunk_elapsed_seconds = time.monotonic() - chunk_started_at
-                log_event(
-                    "BULK_DONE",
-                    dataset=dataset_id,
-                    chunk=chunk_label,
-                    requested=len(chunk_doc_ids),
-                    wrote=written_count,
-                    status="ok",
-                    elapsed_seconds=f"{chunk_elapsed_seconds:.2f}",
-                )
+                    missing_payload_count = sum(1 for doc_id in chunk_doc_ids if doc_id not in received_doc_ids)
+                    if missing_payload_count:
+                        log_event(
+                            "BULK_WARN",
+                            dataset=dataset_id,
+                            chunk=chunk_label,
+                            missing_payload=missing_payload_count,
+                        )
+
+                    chunk_elapsed_seconds = time.monotonic() - chunk_started_at
+                    log_event(
+                        "BULK_DONE",
+                        dataset=dataset_id,
+                        chunk=chunk_label,
+                        requested=len(chunk_doc_ids),
+                        wrote=written_count,
+                        status="ok",
+                        elapsed_seconds=f"{chunk_elapsed_seconds:.2f}",
+                    )
+            finally:
+                if bulk_pool is not None:
+                    for future in bulk_in_flight.values():
+                        future.cancel()
+                    bulk_pool.shutdown(wait=True)
+                    # Drop fetched-but-unconsumed responses so their spool files are freed now.
+                    bulk_in_flight.clear()
             if bulk_disabled_after_error:
                 log_event("BULK_FALLBACK", dataset=dataset_id, mode="per_doc")
 
-            for doc_index, doc in tqdm(enumerate(docs[resume_doc_index:], start=resume_doc_index), total=len(docs) - resume_doc_index, desc=f"Docs {dataset_id}", unit="doc", leave=False):
-                doc_id = extract_doc_id(doc)
-                if not doc_id:
-                    stats.skipped_missing_doc_id += 1
+            prefetch_pool: Optional[ThreadPoolExecutor] = None
+            prefetch_futures: Dict[str, Any] = {}
+            prefetch_downloaded = 0
+            prefetch_failed = 0
+            if (
+                args.download_workers > 1
+                and not args.dry_run
+                and (args.disable_bulk_download or bulk_disabled_after_error)
+            ):
+                prefetch_jobs: List[Tuple[str, Path, Dict[str, object]]] = []
+                prefetch_doc_ids: Set[str] = set()
+                for doc in docs[resume_doc_index:]:
+                    target = doc["__target"]
+                    if target is None:
+                        continue
+                    doc_id = target.doc_id
+                    if doc_id in bulk_written_doc_ids or doc_id in prefetch_doc_ids:
+                        continue
+                    destination = pending_download_destination(target)
+                    if destination is None:
+                        continue
+                    prefetch_doc_ids.add(doc_id)
+                    prefetch_jobs.append((doc_id, destination, doc))
+                if prefetch_jobs:
+                    prefetch_started_at = time.monotonic()
                     log_event(
-                        "DOC_WARN",
+                        "PREFETCH_START",
                         dataset=dataset_id,
-                        index=f"{doc_index + 1}/{len(docs)}",
-                        reason="missing_doc_id",
+                        docs=len(prefetch_jobs),
+                        workers=args.download_workers,
                     )
-                    dataset_summary["docs_processed"] += 1
-                    save_doc_checkpoint(doc_index, "", doc)
-                    continue
-                doc_started_at = time.monotonic()
-                filename = choose_filename(doc)
-                filename = with_doc_id_suffix(filename, doc_id)
-                dataset_subdir = dataset_subdir_from_doc(doc)
-                destination = outdir / dataset_id / dataset_subdir / filename
-                monthly_path = monthly_csv_path(outdir, dataset_id, dataset_subdir)
-                marker_path = marker_path_for_monthly(monthly_path)
-                if args.consolidate_monthly:
-                    known_doc_ids = marker_cache.get(marker_path)
-                    if known_doc_ids is None:
-                        known_doc_ids = load_marker_doc_ids(marker_path)
-                        marker_cache[marker_path] = known_doc_ids
-                    if doc_id in known_doc_ids:
-                        if args.delete_source_after_consolidation and not args.dry_run and destination.exists():
-                            try:
-                                destination.unlink()
-                            except Exception as exc:  # noqa: BLE001
+                    # Downloads run ahead on the pool while the loop below processes docs
+                    # in order, waiting only for the doc it is about to handle.
+                    prefetch_pool = ThreadPoolExecutor(max_workers=args.download_workers)
+                    for doc_id, destination, doc in prefetch_jobs:
+                        prefetch_futures[doc_id] = prefetch_pool.submit(
+                            client.download_doc, dataset_id, doc_id, destination, doc
+                        )
+
+            # Extraction runs off this thread so it overlaps the next download; failures are
+            # collected once the doc loop ends, before the dataset status is settled.
+            extract_pool = (
+                ThreadPoolExecutor(max_workers=args.extract_workers)
+                if args.extract_zips and args.extract_workers > 0 and not args.dry_run
+                else None
+            )
+            extract_futures: List[Tuple[str, Dict[str, Any], Any]] = []
+
+            def extract_downloaded_zip(doc_id: str, destination: Path, doc: Dict[str, Any]) -> None:
+                if extract_pool is None:
+                    maybe_extract_zip(destination)
+                elif destination.suffix.lower() == ".zip":
+                    extract_futures.append((doc_id, doc, extract_pool.submit(maybe_extract_zip, destination)))
+
+            try:
+                for doc_index, doc in progress_bar(enumerate(docs[resume_doc_index:], start=resume_doc_index), total=len(docs) - resume_doc_index, desc=f"Docs {dataset_id}", unit="doc", leave=False):
+                    target = doc["__target"]
+                    if target is None:
+                        stats.skipped_missing_doc_id += 1
+                        log_event(
+                            "DOC_WARN",
+                            dataset=dataset_id,
+                            index=f"{doc_index + 1}/{len(docs)}",
+                            reason="missing_doc_id",
+                        )
+                        dataset_summary["docs_processed"] += 1
+                        save_doc_checkpoint(doc_index, "", doc)
+                        continue
+                    doc_id = target.doc_id
+                    prefetch_future = prefetch_futures.pop(doc_id, None)
+                    if prefetch_future is not None:
+                        # Failed prefetches are retried (and recorded) by the sequential download below.
+                        # exception() waits for the download, so the stat sees the renamed file.
+                        prefetch_error = prefetch_future.exception()
+                        refresh_file_size(target)
+                        if prefetch_error is None:
+                            bulk_written_doc_ids.add(doc_id)
+                            prefetch_downloaded += 1
+                        else:
+                            prefetch_failed += 1
+                    doc_started_at = time.monotonic()
+                    filename = target.filename
+                    dataset_subdir = target.subdir
+                    destination = target.destination
+                    monthly_path = target.monthly_path
+                    marker_path = target.marker_path
+                    if consolidate_monthly:
+                        if doc_id in consolidated_doc_ids(marker_path):
+                            if (
+                                delete_source_after_consolidation
+                                and not dry_run
+                                and file_size_on_disk(target) >= 0
+                            ):
+                                try:
+                                    destination.unlink()
+                                    forget_file(target)
+                                except Exception as exc:  # noqa: BLE001
+                                    log_event(
+                                        "SOURCE_DELETE_WARN",
+                                        dataset=dataset_id,
+                                        doc_id=doc_id,
+                                        file=destination,
+                                        error=str(exc),
+                                    )
+                            stats.skipped_existing += 1
+                            dataset_summary["docs_processed"] += 1
+                            save_doc_checkpoint(doc_index, doc_id, doc)
+                            continue
+                    wanted_size = target.wanted_size
+                    size_on_disk = file_size_on_disk(target)
+                    exists_and_matches = size_on_disk >= 0 and (wanted_size < 0 or size_on_disk == wanted_size)
+                    if exists_and_matches and not consolidate_monthly:
+                        if doc_id in bulk_written_doc_ids:
+                            bulk_written_doc_ids.remove(doc_id)
+                            stats.downloaded += 1
+                            dataset_summary["docs_downloaded"] += 1
+                            if extract_zips:
+                                extract_downloaded_zip(doc_id, destination, doc)
+                        else:
+                            stats.skipped_existing += 1
+                        dataset_summary["docs_processed"] += 1
+                        save_doc_checkpoint(doc_index, doc_id, doc)
+                        continue
+                    if dry_run:
+                        if consolidate_monthly:
+                            if exists_and_matches:
                                 log_event(
-                                    "SOURCE_DELETE_WARN",
+                                    "DRY_RUN",
                                     dataset=dataset_id,
+                                    action="consolidate_existing",
                                     doc_id=doc_id,
-                                    file=destination,
-                                    error=str(exc),
+                                    source=destination,
+                                    target=monthly_path,
+                                )
+                            else:
+                                log_event(
+                                    "DRY_RUN",
+                                    dataset=dataset_id,
+                                    action="download_and_consolidate",
+                                    doc_id=doc_id,
+                                    destination=destination,
+                                    target=monthly_path,
                                 )
-                        stats.skipped_existing += 1
-                        dataset_summary["docs_processed"] += 1
-                        save_doc_checkpoint(doc_index, doc_id, doc)
-                        continue
-                wanted_size = expected_size(doc)
-                exists_and_matches = (
-                    destination.exists()
-                    and (wanted_size < 0 or destination.stat().st_size == wanted_size)
-                )
-                if exists_and_matches and not args.consolidate_monthly:
-                    if doc_id in bulk_written_doc_ids:
-                        bulk_written_doc_ids.remove(doc_id)
-                        stats.downloaded += 1
-                        dataset_summary["docs_downloaded"] += 1
-                        if args.extract_zips:
-                            maybe_extract_zip(destination)
-                    else:
-                        stats.skipped_existing += 1
-                    dataset_summary["docs_processed"] += 1
-                    save_doc_checkpoint(doc_index, doc_id, doc)
-                    continue
-                if args.dry_run:
-                    if args.consolidate_monthly:
-                        if exists_and_matches:
-                            log_event(
-                                "DRY_RUN",
-                                dataset=dataset_id,
-                                action="consolidate_existing",
-                                doc_id=doc_id,
-                                source=destination,
-                                target=monthly_path,
-                            )
                         else:
                             log_event(
                                 "DRY_RUN",
                                 dataset=dataset_id,
-                                action="download_and_consolidate",
+                                action="download",
                                 doc_id=doc_id,
                                 destination=destination,
-                                target=monthly_path,
                             )
-                    else:
-                        log_event(
-                            "DRY_RUN",
-                            dataset=dataset_id,
-                            action="download",
-                            doc_id=doc_id,
-                            destination=destination,
-                        )
-                    dataset_summary["docs_processed"] += 1
-                    save_doc_checkpoint(doc_index, doc_id, doc)
-                    continue
-                try:
-                    source_path = destination
-                    downloaded_now = False
-                    if not (args.consolidate_monthly and exists_and_matches):
-                        if doc_id in bulk_written_doc_ids:
+                        dataset_summary["docs_processed"] += 1
+                        save_doc_checkpoint(doc_index, doc_id, doc)
+                        continue
+                    try:
+                        source_path = destination
+                        downloaded_now = False
+                        if not (consolidate_monthly and exists_and_matches):
+                            if doc_id in bulk_written_doc_ids:
+                                bulk_written_doc_ids.remove(doc_id)
+                            else:
+                                try:
+                                    client.download_doc(dataset_id, doc_id, destination, doc)
+                                finally:
+                                    refresh_file_size(target)
+                            downloaded_now = True
+                        elif doc_id in bulk_written_doc_ids:
                             bulk_written_doc_ids.remove(doc_id)
-                        else:
-                            client.download_doc(dataset_id, doc_id, destination, doc)
-                        downloaded_now = True
-                    elif doc_id in bulk_written_doc_ids:
-                        bulk_written_doc_ids.remove(doc_id)
-                        downloaded_now = True
-                    if args.consolidate_monthly:
-                        post_dt = str(doc.get("postDatetime", "")).strip()
-                        appended_rows = append_doc_to_monthly_csv(source_path, monthly_path, post_datetime=post_dt)
-                        if appended_rows > 0:
-                            stats.consolidated_updates += 1
-                        touched_monthly_paths.add(monthly_path)
-                        known_doc_ids = marker_cache.setdefault(marker_path, set())
-                        if doc_id not in known_doc_ids:
-                            append_marker_doc_id(marker_path, doc_id)
-                            known_doc_ids.add(doc_id)
-                        if args.delete_source_after_consolidation and source_path.exists():
-                            source_path.unlink()
-                    elif args.extract_zips:
-                        maybe_extract_zip(destination)
-                    if downloaded_now:
-                        stats.downloaded += 1
-                        dataset_summary["docs_downloaded"] += 1
-                    dataset_summary["docs_processed"] += 1
-                    consecutive_network_failures = 0
-                except Exception as exc:  # noqa: BLE001
-                    stats.failures += 1
-                    dataset_summary["docs_failed"] += 1
-                    dataset_summary["status"] = "running_with_failures"
-                    record_failure(
-                        dataset_id=dataset_id,
-                        stage="download",
-                        error=str(exc),
-                        doc_id=doc_id,
-                        page=_safe_int(doc.get("__archive_page"), 0),
-                    )
-                    if args.resume_state:
-                        dataset_state["status"] = "running_with_failures"
-                        dataset_state["last_failed_doc_id"] = doc_id
-                        dataset_state["last_failed_error"] = str(exc)
-                        save_dataset_state(dataset_state_path, dataset_state)
-                    log_event("DOWNLOAD_ERROR", dataset=dataset_id, doc_id=doc_id, error=str(exc))
-                    if is_name_resolution_failure(exc):
-                        consecutive_network_failures += 1
-                        if args.network_failure_cooldown_seconds > 0:
-                            time.sleep(args.network_failure_cooldown_seconds)
-                        if (
-                            args.max_consecutive_network_failures > 0
-                            and consecutive_network_failures >= args.max_consecutive_network_failures
-                        ):
-                            raise SystemExit(
-                                "Stopping download due to repeated DNS/network resolution failures "
-                                f"({consecutive_network_failures} consecutive). "
-                                "Check internet/DNS and rerun; completed docs are resumable via .docids/state."
-                            ) from exc
-                    else:
+                            downloaded_now = True
+                        if consolidate_monthly:
+                            appended_rows = monthly_writer.append(
+                                source_path, monthly_path, post_datetime=target.post_datetime.strip()
+                            )
+                            if appended_rows > 0:
+                                stats.consolidated_updates += 1
+                            touched_monthly_paths.add(monthly_path)
+                            known_doc_ids = marker_cache.setdefault(marker_path, set())
+                            if doc_id not in known_doc_ids:
+                                marker_writer.add(marker_path, doc_id)
+                                known_doc_ids.add(doc_id)
+                            if delete_source_after_consolidation and source_path.exists():
+                                source_path.unlink()
+                                forget_file(target)
+                        elif extract_zips:
+                            extract_downloaded_zip(doc_id, destination, doc)
+                        if downloaded_now:
+                            stats.downloaded += 1
+                            dataset_summary["docs_downloaded"] += 1
+                        dataset_summary["docs_processed"] += 1
                         consecutive_network_failures = 0
-                    continue
-
-                save_doc_checkpoint(doc_index, doc_id, doc)
-
-                if args.file_timing_frequency != "off":
-                    completed_at = datetime.now().astimezone().isoformat(timespec="seconds")
-                    elapsed_seconds = time.monotonic() - doc_started_at
-                    stampdate = str(doc.get("postDatetime") or "-")
-                    parsed_stampdate = parse_api_datetime(stampdate)
-                    if parsed_stampdate is not None:
-                        stampdate_date = parsed_stampdate.date().isoformat()
-                        stampdate_day = parsed_stampdate.day
-                    elif "T" in stampdate:
-                        stampdate_date = stampdate.split("T", 1)[0]
-                        try:
-                            stampdate_day = int(stampdate_date.split("-")[2])
-                        except Exception:  # noqa: BLE001
-                            stampdate_day = -1
-                    else:
-                        stampdate_date = "-"
-                        stampdate_day = -1
-                    if args.consolidate_monthly:
-                        action = "download+consolidate" if downloaded_now else "consolidate-existing"
-                        output_file = monthly_path
-                        year = monthly_path.parent.parent.name if monthly_path.parent.parent.name.isdigit() else "-"
-                        month = monthly_path.parent.name if monthly_path.parent.name.isdigit() else "-"
-                    else:
-                        action = "download"
-                        output_file = destination
-                        year = dataset_subdir.parts[0] if len(dataset_subdir.parts) >= 2 else "-"
-                        month = dataset_subdir.parts[1] if len(dataset_subdir.parts) >= 2 else "-"
-                    month_key = f"{year}-{month}" if year != "-" and month != "-" else "-"
-
-                    if args.file_timing_frequency == "every-file":
-                        log_event(
-                            "FILE_COMPLETE",
-                            action=action,
-                            dataset=dataset_id,
+                    except Exception as exc:  # noqa: BLE001
+                        stats.failures += 1
+                        dataset_summary["docs_failed"] += 1
+                        dataset_summary["status"] = "running_with_failures"
+                        record_failure(
+                            dataset_id=dataset_id,
+                            stage="download",
+                            error=str(exc),
                             doc_id=doc_id,
-                            file=output_file,
-                            stampdate=stampdate,
-                            date=stampdate_date,
-                            year=year,
-                            month=month,
-                            elapsed_seconds=f"{elapsed_seconds:.2f}",
-                            completed_at=completed_at,
+                            page=target.archive_page,
                         )
-                    elif args.file_timing_frequency in stampdate_thresholds:
-                        threshold = stampdate_thresholds[args.file_timing_frequency]
-                        if current_stampdate is None:
-                            current_stampdate = stampdate
-                            current_stampdate_files = 1
-                            current_stampdate_year = year
-                            current_stampdate_month = month
-                        elif stampdate == current_stampdate:
-                            current_stampdate_files += 1
+                        if resume_state:
+                            dataset_state["status"] = "running_with_failures"
+                            dataset_state["last_failed_doc_id"] = doc_id
+                            dataset_state["last_failed_error"] = str(exc)
+                            state_writer.save()
+                        log_event("DOWNLOAD_ERROR", dataset=dataset_id, doc_id=doc_id, error=str(exc))
+                        if is_name_resolution_failure(exc):
+                            consecutive_network_failures += 1
+                            if args.network_failure_cooldown_seconds > 0:
+                                time.sleep(args.network_failure_cooldown_seconds)
+                            if (
+                                args.max_consecutive_network_failures > 0
+                                and consecutive_network_failures >= args.max_consecutive_network_failures
+                            ):
+                                raise SystemExit(
+                                    "Stopping download due to repeated DNS/network resolution failures "
+                                    f"({consecutive_network_failures} consecutive). "
+                                    "Check internet/DNS and rerun; completed docs are resumable via .docids/state."
+                                ) from exc
                         else:
-                            completed_stampdates += 1
-                            if completed_stampdates % threshold == 0:
-                                log_event(
-                                    "STAMPDATE_COMPLETE",
-                                    dataset=dataset_id,
-                                    stampdate=current_stampdate,
-                                    year=current_stampdate_year,
-                                    month=current_stampdate_month,
-                                    files=current_stampdate_files,
-                                    completed_at=completed_at,
-                                )
-                            current_stampdate = stampdate
-                            current_stampdate_files = 1
-                            current_stampdate_year = year
-                            current_stampdate_month = month
-                    elif args.file_timing_frequency == "daily":
-                        date_key = stampdate_date if stampdate_date != "-" else stampdate
-                        if current_date_key is None:
-                            current_date_key = date_key
-                            current_date_files = 1
-                            current_date_year = year
-                            current_date_month = month
-                        elif date_key == current_date_key:
-                            current_date_files += 1
+                            consecutive_network_failures = 0
+                        continue
+
+                    save_doc_checkpoint(doc_index, doc_id, doc)
+
+                    if file_timing != "off":
+                        elapsed_seconds = time.monotonic() - doc_started_at
+                        stampdate = target.post_datetime or "-"
+                        stampdate_date, stampdate_day = _stampdate_date_and_day(stampdate)
+                        if consolidate_monthly:
+                            action = "download+consolidate" if downloaded_now else "consolidate-existing"
+                            output_file = monthly_path
+                            year = monthly_path.parent.parent.name if monthly_path.parent.parent.name.isdigit() else "-"
+                            month = monthly_path.parent.name if monthly_path.parent.name.isdigit() else "-"
                         else:
+                            action = "download"
+                            output_file = destination
+                            year = dataset_subdir.parts[0] if len(dataset_subdir.parts) >= 2 else "-"
+                            month = dataset_subdir.parts[1] if len(dataset_subdir.parts) >= 2 else "-"
+                        month_key = f"{year}-{month}" if year != "-" and month != "-" else "-"
+
+                        if file_timing == "every-file":
                             log_event(
-                                "DAY_COMPLETE",
-                                dataset=dataset_id,
-                                date=current_date_key,
-                                year=current_date_year,
-                                month=current_date_month,
-                                files=current_date_files,
-                                completed_at=completed_at,
-                            )
-                            current_date_key = date_key
-                            current_date_files = 1
-                            current_date_year = year
-                            current_date_month = month
-                    elif args.file_timing_frequency in calendar_day_schedules:
-                        schedule_days = calendar_day_schedules[args.file_timing_frequency]
-                        if stampdate_day in schedule_days and stampdate_date not in printed_calendar_dates:
-                            log_event(
-                                "DATE_SCHEDULE_HIT",
-                                schedule=args.file_timing_frequency,
+                                "FILE_COMPLETE",
+                                action=action,
                                 dataset=dataset_id,
+                                doc_id=doc_id,
+                                file=output_file,
+                                stampdate=stampdate,
                                 date=stampdate_date,
-                                day=stampdate_day,
                                 year=year,
                                 month=month,
-                                doc_id=doc_id,
-                                completed_at=completed_at,
-                            )
-                            printed_calendar_dates.add(stampdate_date)
-                    elif args.file_timing_frequency == "1-month":
-                        if current_month_key is None:
-                            current_month_key = month_key
-                            current_month_files = 1
-                        elif month_key == current_month_key:
-                            current_month_files += 1
-                        else:
-                            log_event(
-                                "MONTH_COMPLETE",
-                                dataset=dataset_id,
-                                month=current_month_key,
-                                files=current_month_files,
-                                completed_at=completed_at,
+                                elapsed_seconds=f"{elapsed_seconds:.2f}",
+                                completed_at=local_now_iso(),
                             )
-                            current_month_key = month_key
-                            current_month_files = 1
-
-                if args.write_manifest:
-                    manifest_rows.append(
-                        {
-                            "dataset_id": dataset_id,
-                            "title": DATASETS.get(dataset_id, {}).get("title"),
-                            "report_name": product_title,
-                            "doc_id": doc_id,
-                            "postDateTime": doc.get("postDatetime"),
-                            "post_datetime": doc.get("postDatetime"),
-                            "filename": filename,
-                            "destination": str(destination),
-                            "consolidated_destination": str(monthly_path) if args.consolidate_monthly else None,
-                            "size": doc.get("size"),
-                        }
+                        elif stampdate_threshold is not None:
+                            if current_stampdate is None:
+                                current_stampdate = stampdate
+                                current_stampdate_files = 1
+                                current_stampdate_year = year
+                                current_stampdate_month = month
+                            elif stampdate == current_stampdate:
+                                current_stampdate_files += 1
+                            else:
+                                completed_stampdates += 1
+                                if completed_stampdates % stampdate_threshold == 0:
+                                    log_event(
+                                        "STAMPDATE_COMPLETE",
+                                        dataset=dataset_id,
+                                        stampdate=current_stampdate,
+                                        year=current_stampdate_year,
+                                        month=current_stampdate_month,
+                                        files=current_stampdate_files,
+                                        completed_at=local_now_iso(),
+                                    )
+                                current_stampdate = stampdate
+                                current_stampdate_files = 1
+                                current_stampdate_year = year
+                                current_stampdate_month = month
+                        elif file_timing == "daily":
+                            date_key = stampdate_date if stampdate_date != "-" else stampdate
+                            if current_date_key is None:
+                                current_date_key = date_key
+                                current_date_files = 1
+                                current_date_year = year
+                                current_date_month = month
+                            elif date_key == current_date_key:
+                                current_date_files += 1
+                            else:
+                                log_event(
+                                    "DAY_COMPLETE",
+                                    dataset=dataset_id,
+                                    date=current_date_key,
+                                    year=current_date_year,
+                                    month=current_date_month,
+                                    files=current_date_files,
+                                    completed_at=local_now_iso(),
+                                )
+                                current_date_key = date_key
+                                current_date_files = 1
+                                current_date_year = year
+                                current_date_month = month
+                        elif schedule_days is not None:
+                            if stampdate_day in schedule_days and stampdate_date not in printed_calendar_dates:
+                                log_event(
+                                    "DATE_SCHEDULE_HIT",
+                                    schedule=file_timing,
+                                    dataset=dataset_id,
+                                    date=stampdate_date,
+                                    day=stampdate_day,
+                                    year=year,
+                                    month=month,
+                                    doc_id=doc_id,
+                                    completed_at=local_now_iso(),
+                                )
+                                printed_calendar_dates.add(stampdate_date)
+                        elif file_timing == "1-month":
+                            if current_month_key is None:
+                                current_month_key = month_key
+                                current_month_files = 1
+                            elif month_key == current_month_key:
+                                current_month_files += 1
+                            else:
+                                log_event(
+                                    "MONTH_COMPLETE",
+                                    dataset=dataset_id,
+                                    month=current_month_key,
+                                    files=current_month_files,
+                                    completed_at=local_now_iso(),
+                                )
+                                current_month_key = month_key
+                                current_month_files = 1
+
+                    if manifest_writer is not None:
+                        post_datetime = doc.get("postDatetime")
+                        manifest_writer.add(
+                            {
+                                "dataset_id": dataset_id,
+                                "title": catalog_title,
+                                "report_name": product_title,
+                                "doc_id": doc_id,
+                                "postDateTime": post_datetime,
+                                "post_datetime": post_datetime,
+                                "filename": filename,
+                                "destination": str(destination),
+                                "consolidated_destination": str(monthly_path) if consolidate_monthly else None,
+                                "size": doc.get("size"),
+                            }
+                        )
+            finally:
+                if prefetch_pool is not None:
+                    for future in prefetch_futures.values():
+                        future.cancel()
+                    prefetch_pool.shutdown(wait=True)
+                    log_event(
+                        "PREFETCH_DONE",
+                        dataset=dataset_id,
+                        downloaded=prefetch_downloaded,
+                        failed=prefetch_failed,
+                        elapsed_seconds=f"{time.monotonic() - prefetch_started_at:.2f}",
                     )
+                if extract_pool is not None:
+                    extract_pool.shutdown(wait=True)
 
-            if args.file_timing_frequency in stampdate_thresholds and current_stampdate is not None:
+            for doc_id, doc, future in extract_futures:
+                exc = future.exception()
+                if exc is None:
+                    continue
+                # Counted as a failed doc, as when extraction runs inline.
+                stats.downloaded -= 1
+                stats.failures += 1
+                dataset_summary["docs_downloaded"] -= 1
+                dataset_summary["docs_processed"] -= 1
+                dataset_summary["docs_failed"] += 1
+                dataset_summary["status"] = "running_with_failures"
+                record_failure(
+                    dataset_id=dataset_id,
+                    stage="extract",
+                    error=str(exc),
+                    doc_id=doc_id,
+                    page=_safe_int(doc.get("__archive_page"), 0),
+                )
+                if args.resume_state:
+                    dataset_state["status"] = "running_with_failures"
+                    dataset_state["last_failed_doc_id"] = doc_id
+                    dataset_state["last_failed_error"] = str(exc)
+                    state_writer.save()
+                log_event("EXTRACT_ERROR", dataset=dataset_id, doc_id=doc_id, error=str(exc))
+            extract_futures.clear()
+
+            if stampdate_threshold is not None and current_stampdate is not None:
                 completed_stampdates += 1
-                threshold = stampdate_thresholds[args.file_timing_frequency]
-                if completed_stampdates % threshold == 0:
-                    completed_at = datetime.now().astimezone().isoformat(timespec="seconds")
+                if completed_stampdates % stampdate_threshold == 0:
+                    completed_at = local_now_iso()
                     log_event(
                         "STAMPDATE_COMPLETE",
                         dataset=dataset_id,
@@ -3139,8 +4622,8 @@ def main() -> None:
                         files=current_stampdate_files,
                         completed_at=completed_at,
                     )
-            if args.file_timing_frequency == "daily" and current_date_key is not None:
-                completed_at = datetime.now().astimezone().isoformat(timespec="seconds")
+            if file_timing == "daily" and current_date_key is not None:
+                completed_at = local_now_iso()
                 log_event(
                     "DAY_COMPLETE",
                     dataset=dataset_id,
@@ -3150,8 +4633,8 @@ def main() -> None:
                     files=current_date_files,
                     completed_at=completed_at,
                 )
-            if args.file_timing_frequency == "1-month" and current_month_key is not None:
-                completed_at = datetime.now().astimezone().isoformat(timespec="seconds")
+            if file_timing == "1-month" and current_month_key is not None:
+                completed_at = local_now_iso()
                 log_event(
                     "MONTH_COMPLETE",
                     dataset=dataset_id,
@@ -3160,16 +4643,14 @@ def main() -> None:
                     completed_at=completed_at,
                 )
 
+            monthly_writer.release()
             monthly_paths_to_sort: Set[Path] = set()
             dataset_root = outdir / dataset_id
             if args.consolidate_monthly:
                 monthly_paths_to_sort.update(touched_monthly_paths)
             if args.sort_existing_monthly:
                 monthly_paths_to_sort.update(
-                    path
-                    for path in dataset_root.glob("**/*.csv")
-                    if path.is_file()
-                    and monthly_csv_in_window(path, dataset_root, dataset_from_date, args.to_date)
+                    iter_monthly_csv_files_in_window(dataset_root, dataset_from_date, args.to_date)
                 )
             if monthly_sort_order and monthly_paths_to_sort:
                 log_event(
@@ -3179,36 +4660,14 @@ def main() -> None:
                     order=monthly_sort_order,
                     strategy=args.monthly_sort_strategy,
                 )
-                for monthly_path in sorted(monthly_paths_to_sort):
-                    try:
-                        sort_status = sort_monthly_csv(
-                            monthly_path,
-                            monthly_sort_order,
-                            args.monthly_sort_strategy,
-                        )
-                    except Exception as exc:  # noqa: BLE001
-                        stats.monthly_sort_failures += 1
-                        record_failure(
-                            dataset_id=dataset_id,
-                            stage="monthly-sort",
-                            error=str(exc),
-                        )
-                        log_event("MONTHLY_SORT_ERROR", dataset=dataset_id, file=monthly_path, error=str(exc))
-                        continue
-                    if sort_status == "sorted":
-                        stats.monthly_sorted += 1
-                    elif sort_status == "already":
-                        stats.monthly_already_sorted += 1
-                    else:
-                        stats.monthly_sort_skipped += 1
-                    log_event(
-                        "MONTHLY_SORT_DONE",
-                        dataset=dataset_id,
-                        status=sort_status,
-                        file=monthly_path,
-                        order=monthly_sort_order,
-                        strategy=args.monthly_sort_strategy,
+                # Tuple keys compare in C; Path.__lt__ is a Python call per comparison.
+                paths_to_sort = sorted(monthly_paths_to_sort, key=attrgetter("parts"))
+                if sort_executor is not None:
+                    sort_futures.append(
+                        sort_executor.submit(sort_dataset_monthly_csvs, dataset_id, paths_to_sort, monthly_sort_order)
                     )
+                else:
+                    sort_dataset_monthly_csvs(dataset_id, paths_to_sort, monthly_sort_order)
 
             dataset_summary["last_completed_page"] = _safe_int(dataset_state.get("last_completed_page"), 0)
             dataset_summary["last_completed_doc_id"] = dataset_state.get("last_completed_doc_id")
@@ -3217,7 +4676,9 @@ def main() -> None:
                 dataset_summary["status"] = "completed"
             if args.resume_state:
                 dataset_state["status"] = dataset_summary["status"]
-                save_dataset_state(dataset_state_path, dataset_state)
+                state_writer.save()
+            else:
+                marker_writer.flush()
             log_event(
                 "DATASET_DONE",
                 dataset=dataset_id,
@@ -3227,7 +4688,13 @@ def main() -> None:
                 downloaded=dataset_summary["docs_downloaded"],
                 failed=dataset_summary["docs_failed"],
             )
+            with failures_lock:
+                failures_handle.flush()
+                pending_failure_rows = 0
+            run_log_handle.flush()
 
+        for future in sort_futures:
+            future.result()
         summary_fields: Dict[str, object] = {
             "downloaded": stats.downloaded,
             "skipped_existing": stats.skipped_existing,
@@ -3244,11 +4711,8 @@ def main() -> None:
             summary_fields["monthly_files_sort_failures"] = stats.monthly_sort_failures
         log_event("RUN_SUMMARY", **summary_fields)
 
-        if args.write_manifest and manifest_rows:
-            manifest_path = outdir / "download_manifest.json"
-            with open(manifest_path, "w", encoding="utf-8") as handle:
-                json.dump(manifest_rows, handle, indent=2)
-            log_event("MANIFEST_WRITTEN", path=manifest_path)
+        if manifest_writer is not None and manifest_writer.close():
+            log_event("MANIFEST_WRITTEN", path=manifest_writer.path)
     except SystemExit as exc:
         summary_status = "failed"
         fatal_error = str(exc)
@@ -3260,40 +4724,56 @@ def main() -> None:
         record_failure(dataset_id="RUN", stage="fatal", error=fatal_error)
         raise
     finally:
-        elapsed_seconds = time.monotonic() - run_started_monotonic
-        safe_args: Dict[str, Any] = {}
-        for key, value in vars(args).items():
-            if key in {"username", "password", "subscription_key"}:
-                continue
-            if isinstance(value, date):
-                safe_args[key] = value.isoformat()
-            else:
-                safe_args[key] = value
-        run_summary = {
-            "started_at": run_started_at,
-            "finished_at": utc_now_iso(),
-            "status": summary_status,
-            "fatal_error": fatal_error,
-            "elapsed_seconds": round(elapsed_seconds, 3),
-            "run_dir": str(run_dir),
-            "run_log": str(run_log_path),
-            "failures_csv": str(failures_csv_path),
-            "summary_json": str(summary_json_path),
-            "selected_datasets": selected_ids,
-            "args": safe_args,
-            "stats": stats_as_dict(stats),
-            "datasets": dataset_summaries,
-        }
-        try:
-            summary_json_path.write_text(json.dumps(run_summary, indent=2), encoding="utf-8")
-            log_event("SUMMARY_WRITTEN", path=summary_json_path)
-        except Exception as exc:  # noqa: BLE001
-            log_event("SUMMARY_WRITE_WARN", error=str(exc))
-        finally:
-            sys.stdout = original_stdout
-            sys.stderr = original_stderr
-            failures_handle.close()
-            run_log_handle.close()
+        with teardown:
+            if sort_executor is not None:
+                # A failed run still finishes the sort in progress, but drops queued ones.
+                sort_executor.shutdown(wait=True, cancel_futures=True)
+            if earliest_executor is not None:
+                earliest_stop.set()
+                earliest_executor.shutdown(wait=False, cancel_futures=True)
+            if manifest_writer is not None:
+                manifest_writer.discard()
+            try:
+                marker_writer.flush()
+            except Exception as exc:  # noqa: BLE001
+                log_event("MARKER_WRITE_WARN", error=str(exc))
+            if active_state_writer is not None:
+                try:
+                    active_state_writer.flush()
+                except Exception as exc:  # noqa: BLE001
+                    log_event("STATE_WRITE_WARN", error=str(exc))
+            elapsed_seconds = time.monotonic() - run_started_monotonic
+            safe_args: Dict[str, Any] = {}
+            for key, value in vars(args).items():
+                if key in {"username", "password", "subscription_key"}:
+                    continue
+                if isinstance(value, date):
+                    safe_args[key] = value.isoformat()
+                else:
+                    safe_args[key] = value
+            run_summary = {
+                "started_at": run_started_at,
+                "finished_at": utc_now_iso(),
+                "status": summary_status,
+                "fatal_error": fatal_error,
+                "elapsed_seconds": round(elapsed_seconds, 3),
+                "run_dir": str(run_dir),
+                "run_log": str(run_log_path),
+                "failures_csv": str(failures_csv_path),
+                "summary_json": str(summary_json_path),
+                "selected_datasets": selected_ids,
+                "args": safe_args,
+                "stats": stats_as_dict(stats),
+                "datasets": dataset_summaries,
+            }
+            try:
+                # Published by rename, so an interrupted write never leaves a partial summary.
+                summary_tmp_path = summary_json_path.with_suffix(summary_json_path.suffix + ".tmp")
+                _write_file_bytes(summary_tmp_path, _dumps_json(run_summary, pretty=args.pretty_summary).encode("utf-8"))
+                summary_tmp_path.replace(summary_json_path)
+                log_event("SUMMARY_WRITTEN", path=summary_json_path)
+            except Exception as exc:  # noqa: BLE001
+                log_event("SUMMARY_WRITE_WARN", error=str(exc))
 
 
 if __name__ == "__main__":
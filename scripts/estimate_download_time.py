@@ -8,6 +8,7 @@ import csv
 import re
 from dataclasses import dataclass
 from datetime import date, datetime
+from operator import attrgetter
 from pathlib import Path
 from statistics import mean, pstdev
 from typing import Dict, List, Optional, Sequence
@@ -157,7 +158,7 @@ def compute_day_intervals(events: List[DayEvent]) -> Dict[str, List[float]]:
     for dataset, runs in grouped.items():
         dataset_intervals: List[float] = []
         for run_events in runs.values():
-            ordered = sorted(run_events, key=lambda e: e.completed_at)
+            ordered = sorted(run_events, key=attrgetter("completed_at"))
             if len(ordered) < 2:
                 continue
             for prev, curr in zip(ordered, ordered[1:]):
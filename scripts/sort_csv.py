@@ -14,7 +14,7 @@ except ImportError:  # pragma: no cover - optional progress bar
     def tqdm(iterable, **_):  # type: ignore[misc]
         return iterable
 
-from download_ercot_public_reports import monthly_csv_in_window, sort_monthly_csv
+from download_ercot_public_reports import filter_monthly_csvs, iter_sort_monthly_csvs
 
 
 def parse_date(value: str) -> date:
@@ -74,11 +74,7 @@ def main() -> None:
 
         monthly_files = sorted(path for path in dataset_root.glob("**/*.csv") if path.is_file())
         if args.from_date is not None and args.to_date is not None:
-            monthly_files = [
-                path
-                for path in monthly_files
-                if monthly_csv_in_window(path, dataset_root, args.from_date, args.to_date)
-            ]
+            monthly_files = filter_monthly_csvs(monthly_files, dataset_root, args.from_date, args.to_date)
 
         if not monthly_files:
             print(f"DATASET_SKIP dataset={dataset_id} reason=no_monthly_files")
@@ -88,11 +84,10 @@ def main() -> None:
             f"DATASET_PLAN dataset={dataset_id} files={len(monthly_files)} "
             f"order={args.order} strategy={args.strategy}"
         )
-        for path in tqdm(monthly_files, desc=dataset_id, unit="file", leave=False):
+        results = iter_sort_monthly_csvs(monthly_files, args.order, args.strategy)
+        for path, status, exc in tqdm(results, total=len(monthly_files), desc=dataset_id, unit="file", leave=False):
             candidates += 1
-            try:
-                status = sort_monthly_csv(path, args.order, args.strategy)
-            except Exception as exc:  # noqa: BLE001
+            if exc is not None:
                 failures += 1
                 print(f"SORT_ERROR dataset={dataset_id} file={path} error={exc}")
                 continue